@@ -0,0 +1,70 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("faster_whisper")
+pytest.importorskip("psutil")
+
+from uldas.audio import (  # noqa: E402
+    SAMPLE_RATE,
+    _decode_segment_pyav,
+    has_reasonable_volume,
+)
+
+
+def _quiet_speech(dbfs, seconds=5.0):
+    """A 220 Hz voice-band tone with a 4 Hz syllable envelope at *dbfs* RMS."""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    signal = np.sin(2 * np.pi * 220 * t) * (0.5 + 0.5 * np.sin(2 * np.pi * 4 * t))
+    rms = np.sqrt(np.mean(signal * signal))
+    return (signal * 10 ** (dbfs / 20) / rms).astype(np.float32)
+
+
+def test_quiet_speech_passes_after_normalisation():
+    audio = _quiet_speech(-70.0)
+
+    assert has_reasonable_volume(audio)
+    assert has_reasonable_volume((audio * 32768).astype(np.int16))
+
+
+def test_quiet_speech_already_normalised_is_measured_as_is():
+    assert not has_reasonable_volume(_quiet_speech(-70.0), normalised=True)
+    assert has_reasonable_volume(_quiet_speech(-50.0), normalised=True)
+
+
+def test_digital_silence_fails():
+    assert not has_reasonable_volume(np.zeros(SAMPLE_RATE * 5, dtype=np.int16))
+    assert not has_reasonable_volume(np.zeros(0, dtype=np.float32))
+
+
+def _write_offset_mkv(path, start_time):
+    """20 s of PCM starting at *start_time*: a tone, then 10 s of silence."""
+    av = pytest.importorskip("av")
+    from fractions import Fraction
+
+    with av.open(str(path), "w", format="matroska") as out:
+        stream = out.add_stream("pcm_s16le", rate=SAMPLE_RATE, layout="mono")
+        stream.time_base = Fraction(1, SAMPLE_RATE)
+        step = SAMPLE_RATE // 10
+        for i in range(0, 20 * SAMPLE_RATE, step):
+            tone = np.sin(2 * np.pi * 440 * np.arange(i, i + step) / SAMPLE_RATE)
+            pcm = (tone * 16000 if i < 10 * SAMPLE_RATE else tone * 0).astype(np.int16)
+            frame = av.AudioFrame.from_ndarray(pcm.reshape(1, -1), format="s16",
+                                               layout="mono")
+            frame.sample_rate = SAMPLE_RATE
+            frame.pts = i + start_time * SAMPLE_RATE
+            for packet in stream.encode(frame):
+                out.mux(packet)
+        for packet in stream.encode(None):
+            out.mux(packet)
+
+
+def test_pyav_window_is_relative_to_container_start(tmp_path):
+    path = tmp_path / "offset.mkv"
+    _write_offset_mkv(path, start_time=100)
+
+    tone = _decode_segment_pyav(path, 0, 2, 5)
+    silence = _decode_segment_pyav(path, 0, 12, 5)
+
+    assert tone.size == silence.size == 5 * SAMPLE_RATE
+    assert np.abs(tone).max() > 10000
+    assert not silence.any()
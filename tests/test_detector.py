@@ -0,0 +1,86 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("faster_whisper")
+pytest.importorskip("psutil")
+
+from uldas.detector import (  # noqa: E402
+    _REMUX_SUBTITLE_CODECS,
+    MKVLanguageDetector,
+    ModelLoadError,
+    _pyav_stream_info,
+)
+
+
+def _stream(index, kind, decoder, canonical, metadata=None):
+    codec = SimpleNamespace(name=decoder, canonical_name=canonical)
+    return SimpleNamespace(
+        index=index,
+        type=kind,
+        codec_context=SimpleNamespace(name=decoder, codec=codec),
+        metadata=metadata or {},
+    )
+
+
+def test_pgs_stream_reports_ffprobe_codec_name():
+    st = _stream(2, "subtitle", "pgssub", "hdmv_pgs_subtitle", {"language": "eng"})
+
+    info = _pyav_stream_info(st)
+
+    assert info == {
+        "index": 2,
+        "codec_type": "subtitle",
+        "codec_name": "hdmv_pgs_subtitle",
+        "tags": {"language": "eng"},
+    }
+    assert info["codec_name"] in _REMUX_SUBTITLE_CODECS
+
+
+def test_stream_without_codec_context():
+    st = SimpleNamespace(index=4, type="attachment", codec_context=None, metadata={})
+
+    assert _pyav_stream_info(st)["codec_name"] == ""
+
+
+def _detector(process_file):
+    detector = MKVLanguageDetector.__new__(MKVLanguageDetector)
+    detector.config = SimpleNamespace(show_details=True)
+    detector.process_file = process_file
+    return detector
+
+
+def test_model_load_error_is_fatal_for_the_run(tmp_path):
+    def process_file(fp, _cached_key=None):
+        raise ModelLoadError("Failed to initialise Whisper: no such model")
+
+    with pytest.raises(ModelLoadError):
+        _detector(process_file)._process_one_video(tmp_path / "a.mkv", 1, 1, {})
+
+
+def test_other_errors_fail_only_the_file(tmp_path):
+    def process_file(fp, _cached_key=None):
+        raise OSError("read error")
+
+    result = _detector(process_file)._process_one_video(tmp_path / "a.mkv", 1, 1, {})
+
+    assert result["errors"] == ["read error"]
+
+
+def test_cascade_load_failure_falls_back_to_main_model():
+    detector = MKVLanguageDetector.__new__(MKVLanguageDetector)
+    detector.config = SimpleNamespace(whisper_model="small", cascade_model="tnyi")
+    detector._cascade_failed = False
+    detector._model_lock = threading.Lock()
+    calls = []
+
+    def get_model(name):
+        calls.append(name)
+        raise ModelLoadError("Failed to initialise Whisper: no such model")
+
+    detector._get_model = get_model
+
+    assert detector.cascade_model is None
+    assert detector.cascade_model is None
+    assert calls == ["tnyi"]
@@ -1,21 +1,69 @@
 #file: uldas/audio.py
 
+import re
 import subprocess
-import tempfile
 import logging
 import gc
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple, Union
+
+import numpy as np
 
 from uldas.utils import (
+    cuda_available,
     limit_subprocess_resources,
     normalize_language_code,
     is_likely_hallucination,
 )
-from uldas.constants import LANGUAGE_CODES
+from uldas.constants import FFMPEG_BASE_ARGS, LANGUAGE_CODES
 
 logger = logging.getLogger(__name__)
 
+SAMPLE_RATE = 16000
+
+# Boost + band-limit + normalise; helps on quiet or noisy mixes, applied
+# only when a plain decode did not give a confident answer.
+SPEECH_FILTER_CHAIN = "volume=2.0,highpass=f=80,lowpass=f=8000,dynaudnorm=f=200:g=3"
+
+# ffmpeg's complaints about a -map spec itself, as opposed to the data.
+_STREAM_SELECTION_ERROR_RE = re.compile(
+    r"matches no streams|Invalid stream specifier", re.IGNORECASE,
+)
+
+# Either a path to an audio file or mono float32 PCM at SAMPLE_RATE.
+AudioInput = Union[Path, np.ndarray]
+
+
+def _load_audio(audio: AudioInput) -> np.ndarray:
+    """Return *audio* as mono float32 PCM, decoding it if it is a path."""
+    if isinstance(audio, np.ndarray):
+        return audio
+    from faster_whisper.audio import decode_audio
+    return decode_audio(str(audio), sampling_rate=SAMPLE_RATE)
+
+
+# VAD-filtered transcription of anything longer than this (in practice
+# the full-track fallback) decodes its speech chunks in batches.
+BATCHED_TRANSCRIBE_MIN_SECONDS = 300
+BATCHED_TRANSCRIBE_SIZE = 8
+
+
+def _batched_pipeline(whisper_model):
+    """Return a BatchedInferencePipeline wrapping *whisper_model*, or None.
+
+    Built per call: the pipeline is a thin wrapper, and caching it would
+    keep a reference to the model after _MODEL_CACHE has evicted it.
+    """
+    try:
+        from faster_whisper import BatchedInferencePipeline
+    except ImportError:
+        return None
+    return BatchedInferencePipeline(model=whisper_model)
+
+
+def _pcm_s16le_to_float32(pcm: bytes) -> np.ndarray:
+    return np.frombuffer(pcm, np.int16).astype(np.float32) / 32768.0
+
 
 def _log_memory_usage(context: str = "") -> None:
     try:
@@ -26,6 +74,8 @@ def _log_memory_usage(context: str = "") -> None:
                       context, mem.rss / 1024 / 1024, mem.vms / 1024 / 1024)
     except Exception:
         pass
+    if not cuda_available():
+        return
     try:
         import torch
         if torch.cuda.is_available():
@@ -40,12 +90,13 @@ def _log_memory_usage(context: str = "") -> None:
 def _cleanup_memory() -> None:
     """Aggressively free memory after transcription."""
     gc.collect()
-    try:
-        import torch
-        if torch.cuda.is_available():
-            torch.cuda.empty_cache()
-    except Exception:
-        pass
+    if cuda_available():
+        try:
+            import torch
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except Exception:
+            pass
     try:
         import ctypes
         libc = ctypes.CDLL("libc.so.6")
@@ -57,58 +108,79 @@ _cleanup_cuda_memory = _cleanup_memory
 
 
 # ── Volume check ─────────────────────────────────────────────────────────
-def has_reasonable_volume(ffmpeg: str, audio_path: Path) -> bool:
-    try:
-        cmd = [
-            ffmpeg, "-i", str(audio_path),
-            "-af", "volumedetect",
-            "-f", "null", "-", "-v", "quiet", "-stats",
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True,
-                                encoding="utf-8", errors="replace")
-        if "mean_volume:" in result.stderr:
-            for line in result.stderr.split("\n"):
-                if "mean_volume:" in line:
-                    try:
-                        db = float(line.split("mean_volume:")[1].split("dB")[0].strip())
-                        return db > -60.0
-                    except (ValueError, IndexError):
-                        pass
-        return True
-    except Exception:
-        return True
+# Tuned on volumedetect's mean_volume of SPEECH_FILTER_CHAIN output, so
+# unfiltered samples are measured after an approximation of that chain's
+# gain: volume=2.0, then dynaudnorm's defaults (200 ms frames scaled
+# towards a 0.95 peak, at most 10x).
+MIN_MEAN_VOLUME_DB = -60.0
+_VOLUME_PRE_GAIN = 2.0
+_NORM_FRAME = SAMPLE_RATE // 5
+_NORM_PEAK = 0.95
+_NORM_MAX_GAIN = 10.0
+
+# A cascade (small) model's answer is trusted without consulting the
+# main model once it is at least this sure.
+CASCADE_ACCEPT_PROBABILITY = 0.85
+
+
+def has_reasonable_volume(audio: np.ndarray, normalised: bool = False) -> bool:
+    """Return False for near-silent PCM (mean volume at or below -60 dBFS).
+
+    Same measure as ffmpeg's volumedetect ``mean_volume`` (RMS relative
+    to full scale).  Unless *normalised* says the samples already went
+    through SPEECH_FILTER_CHAIN, the chain's gain is applied first; its
+    band-pass and gain smoothing are left out.
+    """
+    if audio.size == 0:
+        return False
+    samples = audio.astype(np.float64)
+    if audio.dtype == np.int16:
+        samples /= 32768.0
+    if normalised:
+        mean_square = float(np.mean(samples * samples))
+    else:
+        samples *= _VOLUME_PRE_GAIN
+        frames = np.pad(samples, (0, -samples.size % _NORM_FRAME))
+        frames = frames.reshape(-1, _NORM_FRAME)
+        peaks = np.abs(frames).max(axis=1)
+        gains = np.minimum(_NORM_PEAK / np.maximum(peaks, 1e-12), _NORM_MAX_GAIN)
+        energy = np.sum(frames * frames, axis=1) * gains * gains
+        mean_square = float(energy.sum()) / samples.size
+    db = 10.0 * np.log10(mean_square + 1e-12)
+    return db > MIN_MEAN_VOLUME_DB
 
 
 # ── Pre-check: run VAD separately to detect no-speech before Whisper ────
-def _vad_has_speech(audio_path: Path, config, show_details: bool = False) -> bool:
+_vad_api = None
+
+
+def _get_vad_api():
+    """Resolve faster-whisper's VAD helpers once per process."""
+    global _vad_api
+    if _vad_api is None:
+        from faster_whisper.vad import VadOptions, get_speech_timestamps
+        _vad_api = (VadOptions, get_speech_timestamps)
+    return _vad_api
+
+
+def _vad_has_speech(audio_path: AudioInput, config, show_details: bool = False) -> bool:
     """Run Silero VAD on the audio and return True only if speech is found.
 
     This prevents calling whisper_model.transcribe(vad_filter=True) on
     audio where VAD would strip everything, which crashes CTranslate2.
     """
     try:
-        from faster_whisper.audio import decode_audio
-        try:
-            from faster_whisper.vad import VadOptions, get_vad_model, get_speech_timestamps
-        except ImportError:
-            from faster_whisper.vad import (
-                VadOptions,
-                SileroVADModel,
-                get_speech_timestamps,
-            )
-            get_vad_model = SileroVADModel
+        VadOptions, get_speech_timestamps = _get_vad_api()
 
-        audio = decode_audio(str(audio_path), sampling_rate=16000)
+        audio = _load_audio(audio_path)
 
         if show_details:
-            logger.info("Pre-VAD check: audio length %.2f seconds", len(audio) / 16000)
+            logger.info("Pre-VAD check: audio length %.2f seconds", len(audio) / SAMPLE_RATE)
 
         vad_options = VadOptions(
             min_speech_duration_ms=config.vad_min_speech_duration_ms,
             max_speech_duration_s=float(config.vad_max_speech_duration_s),
         )
-
-        model = get_vad_model() if callable(get_vad_model) else get_vad_model
         speech_timestamps = get_speech_timestamps(audio, vad_options)
 
         has_speech = len(speech_timestamps) > 0
@@ -126,7 +198,128 @@ def _vad_has_speech(audio_path: Path, config, show_details: bool = False) -> boo
         return False
 
 
+# ── In-process decode (PyAV) ─────────────────────────────────────────────
+def _decode_segment_pyav(
+    file_path: Path,
+    audio_track_index: int,
+    start: float,
+    duration: float,
+) -> Optional[np.ndarray]:
+    """Decode *duration* seconds of the *audio_track_index*-th audio stream
+    from *start* as mono 16 kHz s16 PCM, without spawning ffmpeg.
+
+    Returns an int16 array, or None when PyAV is unavailable or cannot
+    handle the file (the caller then falls back to the ffmpeg CLI).
+    """
+    decoded = _decode_segments_pyav(file_path, [audio_track_index], start, duration)
+    if decoded is None:
+        return None
+    return decoded.get(audio_track_index)
+
+
+def _decode_segments_pyav(
+    file_path: Path,
+    audio_track_indices: List[int],
+    start: float,
+    duration: float,
+) -> Optional[Dict[int, np.ndarray]]:
+    """Decode the same window from several audio streams in one demux pass.
+
+    Returns ``{audio_track_index: int16 PCM}`` for every stream that
+    produced audio, or None when PyAV is unavailable or cannot open the
+    file.
+    """
+    try:
+        import av
+    except ImportError:
+        return None
+
+    wanted = int(duration * SAMPLE_RATE)
+    try:
+        with av.open(str(file_path)) as container:
+            audio_streams = container.streams.audio
+            selected = {}
+            for track_idx in audio_track_indices:
+                if track_idx < len(audio_streams):
+                    selected[audio_streams[track_idx].index] = track_idx
+            if not selected:
+                return None
+
+            pcm = {t: np.zeros(wanted, dtype=np.int16) for t in selected.values()}
+            filled = {t: 0 for t in selected.values()}
+            resamplers = {
+                t: av.AudioResampler(format="s16", layout="mono", rate=SAMPLE_RATE)
+                for t in selected.values()
+            }
+            pending = set(selected.values())
+
+            # Like ffmpeg's -ss, *start* counts from the container's start
+            # time, which is not zero for e.g. many transport streams.
+            start += (container.start_time or 0) / av.time_base
+            container.seek(int(start * av.time_base))
+            demux_streams = [s for s in audio_streams if s.index in selected]
+            for packet in container.demux(*demux_streams):
+                track_idx = selected.get(packet.stream.index)
+                if track_idx not in pending:
+                    continue
+                for frame in packet.decode():
+                    # Seeking lands on the packet before *start*; drop the lead-in.
+                    if (frame.time is not None
+                            and frame.time + frame.samples / frame.sample_rate < start):
+                        continue
+                    for resampled in resamplers[track_idx].resample(frame):
+                        chunk = resampled.to_ndarray().reshape(-1)
+                        take = min(chunk.size, wanted - filled[track_idx])
+                        pos = filled[track_idx]
+                        pcm[track_idx][pos:pos + take] = chunk[:take]
+                        filled[track_idx] += take
+                if filled[track_idx] >= wanted:
+                    pending.discard(track_idx)
+                    if not pending:
+                        break
+    except Exception as exc:
+        logger.debug("PyAV decode failed for %s (tracks %s): %s",
+                     file_path, audio_track_indices, exc)
+        return None
+    return {t: pcm[t][:n] for t, n in filled.items() if n}
+
+
 # ── Percentage-based sample extraction ───────────────────────────────────
+def _plan_sample_segments(duration: float, retry_attempt: int) -> List[Tuple[int, int]]:
+    """Return the ``(start_s, length_s)`` windows to sample for *retry_attempt*."""
+    min_start = max(60, duration * 0.05)
+    max_start = duration * 0.85
+
+    if duration > 3600:
+        sample_dur = 90
+        all_pcts = [
+            [0.15, 0.25, 0.35, 0.50, 0.65],
+            [0.08, 0.20, 0.45, 0.75, 0.88],
+            [0.12, 0.40, 0.60, 0.80, 0.90],
+        ]
+    elif duration > 1800:
+        sample_dur = 75
+        all_pcts = [
+            [0.15, 0.30, 0.50, 0.70],
+            [0.08, 0.40, 0.65, 0.85],
+            [0.25, 0.45, 0.75, 0.90],
+        ]
+    else:
+        sample_dur = 60
+        all_pcts = [
+            [0.20, 0.50, 0.80],
+            [0.10, 0.35, 0.75],
+            [0.30, 0.60, 0.90],
+        ]
+
+    pcts = all_pcts[min(retry_attempt, len(all_pcts) - 1)]
+    segments = []
+    for p in pcts:
+        s = max(min_start, min(max_start, duration * p))
+        segments.append((int(s), sample_dur))
+    return segments
+
+
 def extract_audio_sample_percentage_based(
     ffmpeg: str,
     ffprobe: str,
@@ -135,45 +328,29 @@ def extract_audio_sample_percentage_based(
     stream_index: int,
     retry_attempt: int = 0,
     show_details: bool = False,
-) -> Optional[Path]:
+    audio_filter: bool = True,
+    duration: Optional[float] = None,
+) -> Optional[np.ndarray]:
+    """Pull a short mono 16 kHz sample out of the track.
+
+    The first attempt decodes plain audio in-process with PyAV.  Retries
+    (reached only after a low-confidence result) or PyAV failures go
+    through ffmpeg, which writes raw PCM to stdout so the sample never
+    touches disk; retries also get the speech clean-up filter chain
+    unless *audio_filter* is False.  Pass *duration* when it is already
+    known to skip the ffprobe call.
+    Returns float32 PCM, or None if every candidate segment failed.
+    """
     try:
-        duration = _get_file_duration(ffprobe, file_path, show_details)
+        if duration is None:
+            duration = _get_file_duration(ffprobe, file_path, show_details)
         if duration <= 0:
             duration = 7200
 
         if show_details:
             logger.info("File duration: %.1f minutes", duration / 60)
 
-        min_start = max(60, duration * 0.05)
-        max_start = duration * 0.85
-
-        if duration > 3600:
-            sample_dur = 90
-            all_pcts = [
-                [0.15, 0.25, 0.35, 0.50, 0.65],
-                [0.08, 0.20, 0.45, 0.75, 0.88],
-                [0.12, 0.40, 0.60, 0.80, 0.90],
-            ]
-        elif duration > 1800:
-            sample_dur = 75
-            all_pcts = [
-                [0.15, 0.30, 0.50, 0.70],
-                [0.08, 0.40, 0.65, 0.85],
-                [0.25, 0.45, 0.75, 0.90],
-            ]
-        else:
-            sample_dur = 60
-            all_pcts = [
-                [0.20, 0.50, 0.80],
-                [0.10, 0.35, 0.75],
-                [0.30, 0.60, 0.90],
-            ]
-
-        pcts = all_pcts[min(retry_attempt, len(all_pcts) - 1)]
-        segments = []
-        for p in pcts:
-            s = max(min_start, min(max_start, duration * p))
-            segments.append((int(s), sample_dur))
+        segments = _plan_sample_segments(duration, retry_attempt)
 
         if show_details:
             logger.info(
@@ -187,39 +364,71 @@ def extract_audio_sample_percentage_based(
             f"a:{audio_track_index}",
         ]
 
+        use_filters = audio_filter and retry_attempt > 0
+        # Only the seek position and -map spec vary between attempts.
+        src = str(file_path)
+        output_args = [
+            "-ar", str(SAMPLE_RATE), "-ac", "1",
+            *(["-af", SPEECH_FILTER_CHAIN] if use_filters else []),
+            "-f", "s16le", "-acodec", "pcm_s16le", "-",
+        ]
+
         for seg_start, seg_dur in segments:
-            for mapping in mappings:
-                tmp = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-                tmp_path = Path(tmp.name)
-                tmp.close()
+            decoded = None
+            if not use_filters:
+                decoded = _decode_segment_pyav(file_path, audio_track_index,
+                                               seg_start, seg_dur)
+            if decoded is not None:
+                if decoded.nbytes > 10_000 and has_reasonable_volume(decoded):
+                    if show_details:
+                        logger.info(
+                            "Decoded audio from %dm%02ds",
+                            seg_start // 60, seg_start % 60,
+                        )
+                    return decoded.astype(np.float32) / 32768.0
+                continue
+
+            for mapping in list(mappings):
                 try:
                     cmd = [
-                        ffmpeg, "-y", "-v", "error",
-                        "-ss", str(seg_start),
-                        "-i", str(file_path),
-                        "-t", str(seg_dur),
-                        "-map", mapping,
-                        "-ar", "16000", "-ac", "1",
-                        "-af", "volume=2.0,highpass=f=80,lowpass=f=8000,dynaudnorm=f=200:g=3",
-                        "-f", "wav", str(tmp_path),
+                        ffmpeg, *FFMPEG_BASE_ARGS, "-v", "error",
+                        "-ss", str(seg_start), "-noaccurate_seek",
+                        "-i", src, "-t", str(seg_dur),
+                        "-map", mapping, *output_args,
                     ]
                     limited = limit_subprocess_resources(cmd)
-                    subprocess.run(limited, check=True, capture_output=True,
-                                   text=True, encoding="utf-8", errors="replace")
-
-                    if tmp_path.exists() and tmp_path.stat().st_size > 10_000:
-                        if has_reasonable_volume(ffmpeg, tmp_path):
-                            if show_details:
-                                logger.info(
-                                    "Extracted audio from %dm%02ds",
-                                    seg_start // 60, seg_start % 60,
-                                )
-                            return tmp_path
-                    if tmp_path.exists():
-                        tmp_path.unlink()
-                except subprocess.CalledProcessError:
-                    if tmp_path.exists():
-                        tmp_path.unlink()
+                    pcm = subprocess.run(limited, check=True,
+                                         capture_output=True).stdout
+                except subprocess.CalledProcessError as exc:
+                    stderr = (exc.stderr or b"").decode("utf-8", "replace")
+                    if _STREAM_SELECTION_ERROR_RE.search(stderr):
+                        # A -map spec that selects nothing is rejected for
+                        # every segment; stop trying it.
+                        mappings.remove(mapping)
+                        continue
+                    # Damaged data or a bad seek: the segment is at fault,
+                    # so keep the mapping and move on to the next one.
+                    if show_details:
+                        logger.debug("Extraction at %ds failed: %s",
+                                     seg_start, stderr.strip()[-200:])
+                    break
+
+                # This spec selects the track, so later segments only need
+                # it; a quiet result means the segment, not the mapping.
+                mappings[:] = [mapping]
+                audio = _pcm_s16le_to_float32(pcm)
+                if len(pcm) > 10_000 and has_reasonable_volume(
+                        audio, normalised=use_filters):
+                    if show_details:
+                        logger.info(
+                            "Extracted audio from %dm%02ds",
+                            seg_start // 60, seg_start % 60,
+                        )
+                    return audio
+                break
+
+            if not mappings:
+                break
 
         logger.error("All percentage-based extraction attempts failed")
         return None
@@ -228,6 +437,47 @@ def extract_audio_sample_percentage_based(
         return None
 
 
+def extract_audio_samples_multi(
+    ffprobe: str,
+    file_path: Path,
+    audio_track_indices: List[int],
+    show_details: bool = False,
+    duration: Optional[float] = None,
+) -> Dict[int, np.ndarray]:
+    """First-attempt samples for several audio tracks of one file.
+
+    Each candidate window is demuxed once and decoded for every track
+    that still needs a sample, instead of opening and seeking the
+    container once per track.  Tracks missing from the result (PyAV
+    failure, silence everywhere) should go through
+    ``extract_audio_sample_percentage_based`` as usual.
+    """
+    samples: Dict[int, np.ndarray] = {}
+    try:
+        if duration is None:
+            duration = _get_file_duration(ffprobe, file_path, show_details)
+        if duration <= 0:
+            duration = 7200
+        pending = list(audio_track_indices)
+        for seg_start, seg_dur in _plan_sample_segments(duration, 0):
+            decoded = _decode_segments_pyav(file_path, pending, seg_start, seg_dur)
+            if decoded is None:
+                break
+            for track_idx, pcm in decoded.items():
+                if pcm.nbytes > 10_000 and has_reasonable_volume(pcm):
+                    samples[track_idx] = pcm.astype(np.float32) / 32768.0
+            pending = [t for t in pending if t not in samples]
+            if not pending:
+                break
+    except Exception as exc:
+        logger.debug("Multi-track sample extraction failed for %s: %s", file_path, exc)
+
+    if show_details:
+        logger.info("Decoded first samples for %d of %d track(s) in a shared pass",
+                    len(samples), len(audio_track_indices))
+    return samples
+
+
 # ── Full-track extraction ────────────────────────────────────────────────
 def extract_full_audio_track(
     ffmpeg: str,
@@ -236,12 +486,14 @@ def extract_full_audio_track(
     stream_index: int,
     timeout: int = 600,
     show_details: bool = False,
-) -> Optional[Path]:
-    try:
-        tmp = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-        tmp_path = Path(tmp.name)
-        tmp.close()
+    audio_filter: bool = True,
+) -> Optional[np.ndarray]:
+    """Decode the whole track to mono 16 kHz float32 PCM.
 
+    ffmpeg writes raw PCM to stdout, so there is no temporary WAV to
+    write, read back and delete.
+    """
+    try:
         mappings = [
             f"0:a:{audio_track_index}",
             f"0:{stream_index}",
@@ -251,35 +503,29 @@ def extract_full_audio_track(
         for mapping in mappings:
             try:
                 cmd = [
-                    ffmpeg, "-y", "-v", "error",
+                    ffmpeg, *FFMPEG_BASE_ARGS, "-v", "error",
                     "-i", str(file_path),
                     "-map", mapping,
-                    "-ar", "16000", "-ac", "1",
-                    "-af", "volume=2.0,highpass=f=80,lowpass=f=8000,dynaudnorm=f=200:g=3",
-                    "-f", "wav", str(tmp_path),
+                    "-ar", str(SAMPLE_RATE), "-ac", "1",
+                ] + (["-af", SPEECH_FILTER_CHAIN] if audio_filter else []) + [
+                    "-f", "s16le", "-acodec", "pcm_s16le", "-",
                 ]
                 limited = limit_subprocess_resources(cmd)
                 if show_details:
                     logger.info("Extracting full audio track %d (timeout: %ds)",
                                 audio_track_index, timeout)
-                subprocess.run(limited, check=True, capture_output=True,
-                               text=True, encoding="utf-8", errors="replace",
-                               timeout=timeout)
-                if tmp_path.exists() and tmp_path.stat().st_size > 10_000:
+                pcm = subprocess.run(limited, check=True, capture_output=True,
+                                     timeout=timeout).stdout
+                if len(pcm) > 10_000:
                     if show_details:
                         logger.info("Successfully extracted full audio track %d",
                                     audio_track_index)
-                    return tmp_path
-                if tmp_path.exists():
-                    tmp_path.unlink()
+                    return _pcm_s16le_to_float32(pcm)
             except subprocess.TimeoutExpired:
                 logger.error("Full audio extraction timed out after %ds", timeout)
-                if tmp_path.exists():
-                    tmp_path.unlink()
                 return None
             except subprocess.CalledProcessError:
-                if tmp_path.exists():
-                    tmp_path.unlink()
+                pass
 
         logger.error("All full audio extraction attempts failed")
         return None
@@ -291,11 +537,12 @@ def extract_full_audio_track(
 # ── Whisper transcription ────────────────────────────────────────────────
 def attempt_transcription(
     whisper_model,
-    audio_path: Path,
+    audio_path: AudioInput,
     use_vad: bool,
     attempt_name: str,
     config,
     ffmpeg: str = None,
+    speech_confirmed: bool = False,
 ) -> Optional[Dict]:
     """Run Whisper on *audio_path*.
 
@@ -304,32 +551,24 @@ def attempt_transcription(
     ``transcribe(vad_filter=True)`` which crashes CTranslate2 on
     zero-length output, and never calling ``transcribe(vad_filter=False)``
     which would waste memory on audio that has no speech anyway.
+    Pass *speech_confirmed* when the caller already ran that check.
     """
+    show_details = config.show_details
     try:
-        if config.show_details:
+        if show_details:
             logger.info("Starting transcription (%s)...", attempt_name)
             _log_memory_usage(f"before_transcription_{attempt_name}")
             print(f"Transcribing audio ({attempt_name})...", flush=True)
 
         # ── Pre-VAD: bail out immediately if no speech ───────────────────
-        if use_vad:
-            if not _vad_has_speech(audio_path, config, config.show_details):
-                if config.show_details:
+        if use_vad and not speech_confirmed:
+            if not _vad_has_speech(audio_path, config, show_details):
+                if show_details:
                     logger.info(
                         "Pre-VAD found no speech – returning zxx without "
                         "calling Whisper (%s)", attempt_name,
                     )
-                return {
-                    "language": "zxx",
-                    "confidence": 0.0,
-                    "text": "",
-                    "text_length": 0,
-                    "word_count": 0,
-                    "segments_detected": 0,
-                    "attempt_name": attempt_name,
-                    "vad_removed_all": True,
-                    "pre_vad_silent": True,
-                }
+                return _pre_vad_silent_result(attempt_name)
 
         vad_options = None
         if use_vad:
@@ -340,8 +579,8 @@ def attempt_transcription(
 
         temperature = 0.0 if attempt_name == "with_vad" else 0.2
 
-        segments, info = whisper_model.transcribe(
-            str(audio_path),
+        audio = _load_audio(audio_path)
+        decode_options = dict(
             language=None,
             task="transcribe",
             beam_size=3,
@@ -363,23 +602,39 @@ def attempt_transcription(
             vad_parameters=vad_options,
         )
 
-        segments_list = list(segments)
+        segments_list = None
+        if use_vad and audio.size > BATCHED_TRANSCRIBE_MIN_SECONDS * SAMPLE_RATE:
+            pipeline = _batched_pipeline(whisper_model)
+            if pipeline is not None:
+                try:
+                    segments, info = pipeline.transcribe(
+                        audio, batch_size=BATCHED_TRANSCRIBE_SIZE, **decode_options,
+                    )
+                    segments_list = list(segments)
+                except (TypeError, ValueError) as exc:
+                    logger.debug("Batched transcription unavailable (%s), "
+                                 "decoding sequentially", exc)
+        if segments_list is None:
+            segments, info = whisper_model.transcribe(audio, **decode_options)
+            segments_list = list(segments)
+
         text_sample = " ".join(seg.text for seg in segments_list).strip()
         vad_removed_all = use_vad and len(segments_list) == 0
 
         confidence = info.language_probability
-        if segments_list:
-            seg_confs = []
-            for seg in segments_list:
-                if hasattr(seg, "avg_logprob") and seg.avg_logprob is not None:
-                    seg_confs.append(min(1.0, max(0.0, seg.avg_logprob + 1.0)))
-            if seg_confs:
-                confidence = max(confidence, sum(seg_confs) / len(seg_confs))
+        logprobs = np.fromiter(
+            (seg.avg_logprob for seg in segments_list
+             if getattr(seg, "avg_logprob", None) is not None),
+            dtype=np.float64,
+        )
+        if logprobs.size:
+            seg_conf = float(np.clip(logprobs + 1.0, 0.0, 1.0).mean())
+            confidence = max(confidence, seg_conf)
 
-        if config.show_details:
+        if show_details:
             logger.info("Detected language: %s (confidence: %.2f, method: %s)",
                         info.language, confidence, attempt_name)
-            logger.info("Sample text: '%s'", text_sample[:150])
+            logger.info("Sample text: %.150r", text_sample)
             logger.info("Segments found: %d", len(segments_list))
             _log_memory_usage(f"after_transcription_{attempt_name}")
 
@@ -403,33 +658,94 @@ def attempt_transcription(
                          attempt_name, exc)
         return None
     except Exception as exc:
-        if config.show_details:
+        if show_details:
             logger.debug("Transcription attempt '%s' failed: %s", attempt_name, exc)
         return None
     finally:
         _cleanup_memory()
 
 
+def _pre_vad_silent_result(attempt_name: str) -> Dict:
+    return {
+        "language": "zxx",
+        "confidence": 0.0,
+        "text": "",
+        "text_length": 0,
+        "word_count": 0,
+        "segments_detected": 0,
+        "attempt_name": attempt_name,
+        "vad_removed_all": True,
+        "pre_vad_silent": True,
+    }
+
+
+def _whisper_to_language_code(language: str) -> str:
+    """Map a Whisper language token (``en``, ``nl`` …) to our ISO 639-2 code."""
+    code = LANGUAGE_CODES.get(language.casefold(), language)
+    if language.lower() in ("dutch", "nl"):
+        code = "dut"
+    return normalize_language_code(code)
+
+
+# ── Language ID without transcription ────────────────────────────────────
+# Upper bound on the 30 s windows one language-ID call may score.  Samples
+# fit well within it; on a full track it keeps an inconclusive result from
+# encoding every window of a multi-hour file.
+LANGUAGE_ID_MAX_WINDOWS = 3
+
+
+def detect_language_only(whisper_model, audio_path: AudioInput, config,
+                         threshold: Optional[float] = None) -> Optional[Dict]:
+    """Identify the spoken language with the encoder and a single decoder
+    step, skipping the autoregressive transcription entirely.
+
+    The sample is scored one 30 s window at a time, at most
+    ``LANGUAGE_ID_MAX_WINDOWS`` of them, and scoring stops at the first
+    window that clears *threshold* (``confidence_threshold`` by default);
+    later windows are only encoded when the earlier ones were
+    inconclusive.
+
+    Returns ``{"language", "confidence"}`` or None if detection failed.
+    """
+    try:
+        audio = _load_audio(audio_path)
+        windows = min(LANGUAGE_ID_MAX_WINDOWS,
+                      max(1, -(-audio.size // (30 * SAMPLE_RATE))))
+        language, probability, _ = whisper_model.detect_language(
+            audio,
+            language_detection_segments=windows,
+            language_detection_threshold=(config.confidence_threshold
+                                          if threshold is None else threshold),
+        )
+        if config.show_details:
+            logger.info("Language ID (no transcription): %s (probability: %.3f)",
+                        language, probability)
+        return {"language": language, "confidence": float(probability)}
+    except Exception as exc:
+        if config.show_details:
+            logger.debug("detect_language failed (%s: %s), falling back to "
+                         "transcription", type(exc).__name__, exc)
+        return None
+
+
 def process_transcription_result(result: Dict, config) -> Optional[str]:
+    show_details = config.show_details
     # Pre-VAD already determined no speech
     if result.get("pre_vad_silent"):
-        if config.show_details:
+        if show_details:
             logger.info("Pre-VAD confirmed no speech – marking as 'zxx'")
         return "zxx"
 
     if result["confidence"] > 0.95 and result["text_length"] > 50:
-        code = LANGUAGE_CODES.get(result["language"].lower(), result["language"])
-        if result["language"].lower() in ("dutch", "nl"):
-            code = "dut"
-        return normalize_language_code(code)
+        return _whisper_to_language_code(result["language"])
 
-    if config.show_details:
+    if show_details:
         logger.info("Checking transcription quality and hallucination patterns...")
     else:
         print("Analyzing transcription quality...", flush=True)
 
-    if result["text"] and is_likely_hallucination(result["text"], config.show_details):
-        if config.show_details:
+    if result["text"] and is_likely_hallucination(result["text"], show_details):
+        if show_details:
             logger.info("Detected likely hallucination – marking as 'zxx'")
         return "zxx"
 
@@ -441,7 +757,7 @@ def process_transcription_result(result: Dict, config) -> Optional[str]:
                 and result["word_count"] > 20)
         )
         if not has_speech:
-            if config.show_details:
+            if show_details:
                 logger.info("VAD removed all audio but transcription produced "
                             "text – likely hallucination")
             return "zxx"
@@ -456,34 +772,143 @@ def process_transcription_result(result: Dict, config) -> Optional[str]:
         )
 
     if has_speech:
-        code = LANGUAGE_CODES.get(result["language"].lower(), result["language"])
-        if result["language"].lower() in ("dutch", "nl"):
-            code = "dut"
-        return normalize_language_code(code)
+        return _whisper_to_language_code(result["language"])
 
-    if config.show_details:
+    if show_details:
         logger.info("Insufficient evidence of speech – marking as 'zxx'")
     return "zxx"
 
 
+# ── Batched language identification ──────────────────────────────────────
+def detect_languages_batch(
+    whisper_model,
+    samples: List[AudioInput],
+    batch_size: int = 8,
+    show_details: bool = False,
+) -> List[Tuple[str, float]]:
+    """Run Whisper's language-ID head over several samples at once.
+
+    Each sample is cut to one 30 s log-mel window and the windows are
+    stacked so the encoder runs once per *batch_size* samples instead
+    of once per sample.  Returns ``(language, probability)`` for every
+    input, in order; samples that fail to decode yield ``("", 0.0)``.
+    """
+    from faster_whisper.audio import pad_or_trim
+
+    results: List[Tuple[str, float]] = [("", 0.0)] * len(samples)
+    if not samples:
+        return results
+    if not whisper_model.model.is_multilingual:
+        return [("en", 1.0)] * len(samples)
+
+    extractor = whisper_model.feature_extractor
+    # All windows live in one contiguous (B, n_mels, frames) array so each
+    # encoder batch is a zero-copy slice instead of a fresh np.stack.
+    mels: Optional[np.ndarray] = None
+    positions: List[int] = []
+    for pos, sample in enumerate(samples):
+        try:
+            audio = _load_audio(sample)
+            mel = pad_or_trim(extractor(audio[: extractor.n_samples])[..., : extractor.nb_max_frames])
+            if mels is None:
+                mels = np.empty((len(samples),) + mel.shape, dtype=np.float32)
+            mels[len(positions)] = mel
+            positions.append(pos)
+        except Exception as exc:
+            if show_details:
+                logger.debug("Batch LID: could not prepare sample %d: %s", pos, exc)
+
+    for start in range(0, len(positions), batch_size):
+        chunk = mels[start:min(start + batch_size, len(positions))]
+        try:
+            encoder_output = whisper_model.encode(chunk)
+            per_sample = whisper_model.model.detect_language(encoder_output)
+        except Exception as exc:
+            logger.error("Batched language detection failed: %s", exc)
+            continue
+        for offset, probs in enumerate(per_sample):
+            token, prob = probs[0]
+            results[positions[start + offset]] = (token[2:-2], float(prob))
+
+    if show_details:
+        logger.info("Batch LID over %d sample(s): %s", len(samples),
+                    ", ".join(f"{lang or '?'}={prob:.2f}" for lang, prob in results))
+    return results
+
+
+def detect_confident_languages_batch(
+    whisper_model, samples: Dict[int, np.ndarray], config,
+) -> Dict[int, str]:
+    """Batch language-ID for the first samples of several tracks.
+
+    Returns ``{audio_track_index: language_code}`` for the tracks whose
+    batched probability clears ``confidence_threshold`` and, with VAD
+    enabled, whose sample contains speech.  Every other track is left
+    out and goes through the regular per-track detection.
+    """
+    if len(samples) < 2:
+        return {}
+    track_ids = list(samples)
+    batch = detect_languages_batch(
+        whisper_model, [samples[t] for t in track_ids],
+        show_details=config.show_details,
+    )
+    resolved: Dict[int, str] = {}
+    for track_idx, (language, probability) in zip(track_ids, batch):
+        if not language or probability < config.confidence_threshold:
+            continue
+        if config.vad_filter and not _vad_has_speech(
+                samples[track_idx], config, config.show_details):
+            continue
+        resolved[track_idx] = _whisper_to_language_code(language)
+    return resolved
+
+
 # ── High-level detection ─────────────────────────────────────────────────
 def detect_language_with_confidence(
-    whisper_model, audio_path: Path, config, ffmpeg: str = None,
+    whisper_model, audio_path: AudioInput, config, ffmpeg: str = None,
+    cascade_model=None,
 ) -> Optional[Dict]:
-    if not audio_path.exists() or audio_path.stat().st_size < 1000:
-        logger.error("Audio file too small or missing: %s", audio_path)
+    if isinstance(audio_path, Path):
+        if not audio_path.exists() or audio_path.stat().st_size < 1000:
+            logger.error("Audio file too small or missing: %s", audio_path)
+            return None
+    # Decode once; VAD, language ID and transcription all reuse the PCM.
+    audio = _load_audio(audio_path)
+    if audio.size < 500:
+        logger.error("Audio sample too short (%d samples)", audio.size)
         return None
 
     vad_removed_all = False
 
     if config.vad_filter:
-        result = attempt_transcription(
-            whisper_model, audio_path, True, "with_vad", config, ffmpeg=ffmpeg,
-        )
-        if result and result.get("pre_vad_silent"):
-            code = process_transcription_result(result, config)
+        if not _vad_has_speech(audio, config, config.show_details):
+            code = process_transcription_result(
+                _pre_vad_silent_result("with_vad"), config,
+            )
             return {"language_code": code, "confidence": 0.0,
                     "method": "pre_vad_silent"}
+
+        # VAD confirmed speech, so a confident language-ID pass is enough;
+        # only fall through to full transcription when it is unsure.
+        if cascade_model is not None:
+            accept = max(CASCADE_ACCEPT_PROBABILITY, config.confidence_threshold)
+            lid = detect_language_only(cascade_model, audio, config, threshold=accept)
+            if lid and lid["confidence"] >= accept:
+                return {"language_code": _whisper_to_language_code(lid["language"]),
+                        "confidence": lid["confidence"],
+                        "method": "cascade_detect_language"}
+
+        lid = detect_language_only(whisper_model, audio, config)
+        if lid and lid["confidence"] >= config.confidence_threshold:
+            return {"language_code": _whisper_to_language_code(lid["language"]),
+                    "confidence": lid["confidence"],
+                    "method": "detect_language"}
+
+        result = attempt_transcription(
+            whisper_model, audio, True, "with_vad", config, ffmpeg=ffmpeg,
+            speech_confirmed=True,
+        )
         if result and result["segments_detected"] > 0:
             code = process_transcription_result(result, config)
             return {"language_code": code, "confidence": result["confidence"],
@@ -492,7 +917,7 @@ def detect_language_with_confidence(
             vad_removed_all = True
 
     result = attempt_transcription(
-        whisper_model, audio_path, False, "without_vad", config, ffmpeg=ffmpeg,
+        whisper_model, audio, False, "without_vad", config, ffmpeg=ffmpeg,
     )
     if result:
         result["vad_removed_all"] = vad_removed_all
@@ -513,30 +938,40 @@ def detect_language_with_retries(
     stream_index: int,
     config,
     max_retries: int = 3,
+    first_sample: Optional[np.ndarray] = None,
+    cascade_model=None,
+    duration: Optional[float] = None,
 ) -> Optional[str]:
+    show_details = config.show_details
     successful = []
     best_confidence = 0.0
     best_result = None
     all_pre_vad_silent = True
 
     for attempt in range(max_retries):
-        if attempt > 0 and config.show_details:
+        if attempt > 0 and show_details:
             logger.info("Retry attempt %d/%d – trying different audio samples",
                         attempt + 1, max_retries)
 
-        sample = extract_audio_sample_percentage_based(
-            ffmpeg, ffprobe, file_path, audio_track_index, stream_index,
-            attempt, config.show_details,
-        )
-        if not sample:
+        if attempt == 0 and first_sample is not None:
+            sample = first_sample
+        else:
+            # Probe at most once per track, and not at all when the
+            # caller already knows the duration.
+            if duration is None:
+                duration = _get_file_duration(ffprobe, file_path, show_details)
+            sample = extract_audio_sample_percentage_based(
+                ffmpeg, ffprobe, file_path, audio_track_index, stream_index,
+                attempt, show_details, config.audio_filter, duration,
+            )
+        if sample is None:
             continue
 
         try:
             res = detect_language_with_confidence(
                 whisper_model, sample, config, ffmpeg=ffmpeg,
+                cascade_model=cascade_model,
             )
-            if sample.exists():
-                sample.unlink()
             if res:
                 code = res.get("language_code")
                 conf = res.get("confidence", 0.0)
@@ -551,22 +986,20 @@ def detect_language_with_retries(
                 if code:
                     successful.append(code)
                     if code != "zxx" and conf >= config.confidence_threshold:
-                        if config.show_details:
+                        if show_details:
                             logger.info("Detected '%s' (conf %.3f) on attempt %d",
                                         code, conf, attempt + 1)
                         return code
 
                 # If pre-VAD says silent, don't waste retries on same file
                 if method == "pre_vad_silent" and code == "zxx":
-                    if config.show_details:
+                    if show_details:
                         logger.info("Pre-VAD confirmed no speech on attempt %d "
                                     "– skipping remaining retries", attempt + 1)
                     return "zxx"
         except Exception as exc:
-            if config.show_details:
+            if show_details:
                 logger.warning("Retry %d error: %s", attempt + 1, exc)
-            if sample and sample.exists():
-                sample.unlink()
 
     if (best_confidence >= config.confidence_threshold
             and best_result and best_result != "zxx"):
@@ -574,11 +1007,11 @@ def detect_language_with_retries(
 
     # If all samples were pre-VAD silent, no point doing full track
     if all_pre_vad_silent and successful and all(s == "zxx" for s in successful):
-        if config.show_details:
+        if show_details:
             logger.info("All samples confirmed silent by pre-VAD – marking as 'zxx'")
         return "zxx"
 
-    if config.show_details:
+    if show_details:
         logger.info("Best confidence (%.3f) below threshold (%.3f) – analysing full track",
                      best_confidence, config.confidence_threshold)
     else:
@@ -587,15 +1020,13 @@ def detect_language_with_retries(
 
     full = extract_full_audio_track(
         ffmpeg, file_path, audio_track_index, stream_index,
-        config.operation_timeout_seconds, config.show_details,
+        config.operation_timeout_seconds, show_details, config.audio_filter,
     )
-    if full:
+    if full is not None:
         try:
             res = detect_language_with_confidence(
                 whisper_model, full, config, ffmpeg=ffmpeg,
             )
-            if full.exists():
-                full.unlink()
             if res:
                 code = res["language_code"]
                 conf = res["confidence"]
@@ -605,8 +1036,7 @@ def detect_language_with_retries(
                     return code
                 return "zxx"
         except Exception:
-            if full and full.exists():
-                full.unlink()
+            pass
 
     if successful:
         from collections import Counter
@@ -621,10 +1051,18 @@ def detect_language_with_retries(
 
 
 # ── Internal helper ──────────────────────────────────────────────────────
+# Matroska stores the segment duration in its header, so probing past
+# the first few KB cannot change the answer.
+_HEADER_DURATION_SUFFIXES = frozenset({".mkv", ".mka", ".webm"})
+
+
 def _get_file_duration(ffprobe: str, file_path: Path, show_details: bool) -> float:
     try:
+        probe_limits = []
+        if file_path.suffix.lower() in _HEADER_DURATION_SUFFIXES:
+            probe_limits = ["-probesize", "32k", "-analyzeduration", "0"]
         cmd = [
-            ffprobe, "-v", "quiet",
+            ffprobe, "-v", "quiet", *probe_limits,
             "-show_entries", "format=duration",
             "-of", "csv=p=0", str(file_path),
         ]
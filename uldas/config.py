@@ -26,8 +26,10 @@ class Config:
         self.path: list[str] = ["."]
         self.ignore_tags: list[str] = []
         self.remux_to_mkv: bool = False
+        self.allow_reencode: bool = True
         self.show_details: bool = True
         self.whisper_model: str = "small"
+        self.cascade_model: str = ""
         self.dry_run: bool = False
         self.temp_dir: str = ""
 
@@ -41,11 +43,13 @@ class Config:
         self.vad_filter: bool = True
         self.vad_min_speech_duration_ms: int = 250
         self.vad_max_speech_duration_s: int = 30
+        self.audio_filter: bool = True
 
         # ── Device / compute ─────────────────────────────────────────────
         self.device: str = "auto"
         self.compute_type: str = "auto"
         self.cpu_threads: int = 0
+        self.max_workers: int = 1
 
         # ── Confidence ───────────────────────────────────────────────────
         self.confidence_threshold: float = 0.9
@@ -77,13 +81,9 @@ class Config:
     # ── Load from YAML ───────────────────────────────────────────────────
     def load_from_file(self, config_path: str = "config/config.yml") -> None:
         config_dir = os.path.dirname(config_path)
-        if config_dir and not os.path.exists(config_dir):
+        if config_dir:
             os.makedirs(config_dir, exist_ok=True)
 
-        if not os.path.exists(config_path):
-            logger.info("Config file %s not found, using defaults", config_path)
-            return
-
         try:
             with open(config_path, "r", encoding="utf-8") as fh:
                 data = yaml.safe_load(fh)
@@ -98,6 +98,8 @@ class Config:
 
             logger.info("Configuration loaded from %s", config_path)
 
+        except FileNotFoundError:
+            logger.info("Config file %s not found, using defaults", config_path)
         except Exception as exc:
             logger.error("Error loading config file %s: %s", config_path, exc)
             logger.info("Using default configuration")
@@ -108,16 +110,20 @@ class Config:
             "path": ["P:/Movies", "P:/TV"],
             "ignore_tags": [],
             "remux_to_mkv": True,
+            "allow_reencode": True,
             "show_details": False,
             "whisper_model": "small",
+            "cascade_model": "",
             "dry_run": True,
             "temp_dir": "",
             "vad_filter": True,
             "vad_min_speech_duration_ms": 250,
             "vad_max_speech_duration_s": 30,
+            "audio_filter": True,
             "device": "auto",
             "compute_type": "auto",
             "cpu_threads": 0,
+            "max_workers": 1,
             "confidence_threshold": 0.9,
             "reprocess_all": False,
             "process_subtitles": True,
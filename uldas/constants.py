@@ -1,9 +1,14 @@
 #file: uldas/constants.py
 
+from types import MappingProxyType
+from typing import Mapping
+
 VERSION = "2026.05.11"
 
 # ── Language name → ISO 639-2 (bibliographic) ────────────────────────────
-LANGUAGE_CODES: dict[str, str] = {
+# Read-only and shared by every module; keys are casefolded names so
+# callers look up with ``name.casefold()``.
+LANGUAGE_CODES: Mapping[str, str] = MappingProxyType({
     "english": "eng",
     "spanish": "spa",
     "french": "fre",
@@ -133,7 +138,7 @@ LANGUAGE_CODES: dict[str, str] = {
     "日本語": "jpn",
     "中文": "chi",
     "한국어": "kor",
-}
+})
 
 # ── ISO 639-2 (3-letter) → ISO 639-1 (2-letter) ─────────────────────────
 ISO639_2_TO_1: dict[str, str] = {
@@ -361,12 +366,17 @@ LANGUAGE_NAMES: dict[str, str] = {
 }
 
 # ── Video file extensions ────────────────────────────────────────────────
-VIDEO_EXTENSIONS: set[str] = {
+VIDEO_EXTENSIONS: frozenset[str] = frozenset({
     ".mp4", ".avi", ".mov", ".wmv", ".flv", ".webm",
     ".m4v", ".m2ts", ".mts", ".ts", ".vob",
-}
+})
 
 # ── External subtitle file extensions ────────────────────────────────────
-EXTERNAL_SUBTITLE_EXTENSIONS: set[str] = {
+EXTERNAL_SUBTITLE_EXTENSIONS: frozenset[str] = frozenset({
     ".srt", ".ass", ".ssa", ".sub", ".vtt", ".idx",
-}
\ No newline at end of file
+})
+
+# ── ffmpeg invocation ────────────────────────────────────────────────────
+# Prepended to every ffmpeg argv: never read stdin (a worker thread must
+# not steal the terminal) and skip the version banner on stderr.
+FFMPEG_BASE_ARGS: tuple[str, ...] = ("-nostdin", "-hide_banner")
@@ -1,25 +1,33 @@
 #file: uldas/detector.py
 
-import gc
-import json
 import os
 import subprocess
 import sys
 import time
 import threading
 import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Callable, List, Dict, Optional, Tuple
 
 from faster_whisper import WhisperModel
 
 from uldas.config import Config
-from uldas.constants import LANGUAGE_CODES, VIDEO_EXTENSIONS, EXTERNAL_SUBTITLE_EXTENSIONS
+from uldas.constants import (
+    EXTERNAL_SUBTITLE_EXTENSIONS,
+    FFMPEG_BASE_ARGS,
+    LANGUAGE_CODES,
+    VIDEO_EXTENSIONS,
+)
 from uldas.tracking import ProcessingTracker
 from uldas.tools import find_executable
 from uldas.utils import (
+    cuda_available,
     setup_cpu_limits,
     limit_subprocess_resources,
+    language_from_track_title,
+    loads_json,
+    walk_files,
     normalize_language_code,
 )
 from uldas import audio as audio_mod
@@ -28,6 +36,52 @@ from uldas import external_subtitles as ext_sub_mod
 
 logger = logging.getLogger(__name__)
 
+# The scheduler builds a fresh MKVLanguageDetector for every run.  Keep
+# the loaded model(s) (keyed by everything passed to WhisperModel) so
+# repeat runs skip the multi-second reload; a settings change replaces them.
+_MODEL_CACHE: Dict[Tuple, WhisperModel] = {}
+# Serialises cache lookups and loads: the scheduler and a web UI-triggered
+# run can construct detectors at the same time.
+_MODEL_CACHE_LOCK = threading.Lock()
+
+
+_EBML_MAGIC = b"\x1a\x45\xdf\xa3"
+
+# Subtitle codecs a remux carries over into Matroska; others are dropped.
+_REMUX_SUBTITLE_CODECS = frozenset({
+    "subrip", "srt", "ass", "ssa", "webvtt", "mov_text",
+    "pgs", "dvdsub", "dvbsub", "hdmv_pgs_subtitle",
+})
+
+
+def _has_ebml_header(path: Path) -> bool:
+    """True if *path* starts with the EBML magic every Matroska file has."""
+    try:
+        with open(path, "rb") as fh:
+            return fh.read(4) == _EBML_MAGIC
+    except OSError:
+        return False
+
+
+def _pyav_stream_info(st) -> Dict:
+    """One ``ffprobe -show_streams`` style entry for a PyAV stream.
+
+    ``codec.canonical_name`` is the codec descriptor name ffprobe reports
+    (``hdmv_pgs_subtitle``, ``dts``); ``codec_context.name`` would be the
+    decoder's (``pgssub``, ``dca``) and miss every codec-name check.
+    """
+    try:
+        ctx = st.codec_context
+        codec_name = ctx.codec.canonical_name if ctx is not None else ""
+    except Exception:
+        codec_name = ""
+    return {
+        "index": st.index,
+        "codec_type": st.type,
+        "codec_name": codec_name,
+        "tags": dict(st.metadata),
+    }
+
 
 def _flush_all_logs() -> None:
     """Flush all log handlers to ensure output is written before critical operations."""
@@ -43,6 +97,10 @@ def _flush_all_logs() -> None:
         pass
 
 
+class ModelLoadError(RuntimeError):
+    """The Whisper model could not be loaded; fatal for the whole run."""
+
+
 class MKVLanguageDetector:
     """Scans directories, detects languages, and updates MKV metadata."""
 
@@ -54,12 +112,16 @@ class MKVLanguageDetector:
         self._cancel_check = cancel_check
         self._cancel_logged = False
         self._reprocess_lang_force_all_audio = False
+        # Guards tracker mutations/saves when max_workers > 1.
+        self._state_lock = threading.Lock()
 
-        # Per-file metadata caches, cleared at the start of each
+        # Per-file metadata caches, cleared at the end of each
         # process_file() call.  ffprobe/mkvmerge are expensive enough
         # that memoizing within a file's processing lifetime is worth
-        # it — several code paths query the same metadata.
-        self._mkv_info_cache: Dict[str, Dict] = {}
+        # it — several code paths query the same metadata.  Stream info
+        # is stored with the file's (mtime_ns, size) so a file rewritten
+        # underneath us (remux, mkvpropedit) is re-probed, not served stale.
+        self._mkv_info_cache: Dict[str, Tuple[Tuple[int, int], Dict]] = {}
         self._duration_cache: Dict[str, float] = {}
         self._format_lang_cache: Dict[str, Dict[int, str]] = {}
 
@@ -98,13 +160,19 @@ class MKVLanguageDetector:
         device = self._determine_device()
         compute_type = self._determine_compute_type(device)
         cpu_threads = config.cpu_threads if config.cpu_threads > 0 else 0
-
-        if config.show_details:
-            logger.info("Initializing faster-whisper: device=%s, compute=%s, model=%s",
-                        device, compute_type, config.whisper_model)
+        if cpu_threads == 0 and device == "cpu" and config.max_workers > 1:
+            # Each of the num_workers CTranslate2 replicas gets its own
+            # thread pool; split the cores instead of oversubscribing them.
+            cpu_threads = max(1, (os.cpu_count() or 1) // config.max_workers)
 
         # ── Whisper model ────────────────────────────────────────────────
-        self.whisper_model = self._init_whisper(device, compute_type, cpu_threads)
+        # Loaded on first use (see the whisper_model property), so runs in
+        # which every track is already labelled never load a model.
+        self._whisper_settings = (device, compute_type, cpu_threads)
+        self._models: Dict[str, WhisperModel] = {}
+        self._model_errors: Dict[str, ModelLoadError] = {}
+        self._cascade_failed = False
+        self._model_lock = threading.Lock()
 
         # ── External tools ───────────────────────────────────────────────
         self.ffmpeg = find_executable("ffmpeg")
@@ -133,8 +201,73 @@ class MKVLanguageDetector:
             pass
         return False
 
+    # ── Whisper models (lazy) ────────────────────────────────────────────
+    @property
+    def whisper_model(self) -> WhisperModel:
+        return self._get_model(self.config.whisper_model)
+
+    @property
+    def cascade_model(self) -> Optional[WhisperModel]:
+        """The optional small model, or None.  It is only a speed-up, so a
+        failed load is warned about once and the main model used alone."""
+        name = self.config.cascade_model
+        if not name or name == self.config.whisper_model or self._cascade_failed:
+            return None
+        try:
+            return self._get_model(name)
+        except ModelLoadError as exc:
+            with self._model_lock:
+                warned, self._cascade_failed = self._cascade_failed, True
+            if not warned:
+                logger.warning("Cascade model '%s' unavailable, using %s only: %s",
+                               name, self.config.whisper_model, exc)
+            return None
+
+    def _get_model(self, model_name: str) -> WhisperModel:
+        """Load *model_name* on first request; later calls, from any worker
+        thread, get the same instance.  A failed load is not retried, and
+        raises ModelLoadError, which per-file error handling lets through."""
+        with self._model_lock:
+            model = self._models.get(model_name)
+            if model is not None:
+                return model
+            if model_name in self._model_errors:
+                raise self._model_errors[model_name]
+            device, compute_type, cpu_threads = self._whisper_settings
+            if self.config.show_details:
+                logger.info("Initializing faster-whisper: device=%s, compute=%s, model=%s",
+                            device, compute_type, model_name)
+            else:
+                print(f"Loading faster-whisper model: {model_name}", flush=True)
+            try:
+                model = self._init_whisper(device, compute_type, cpu_threads, model_name)
+            except ModelLoadError as exc:
+                self._model_errors[model_name] = exc
+                raise
+            self._models[model_name] = model
+            return model
+
     # ── Whisper init (with fallback) ─────────────────────────────────────
-    def _init_whisper(self, device, compute_type, cpu_threads):
+    def _init_whisper(self, device, compute_type, cpu_threads, model_name=None):
+        model_name = model_name or self.config.whisper_model
+        num_workers = max(1, self.config.max_workers)
+        settings = (device, compute_type, cpu_threads, num_workers)
+        cache_key = (model_name,) + settings
+        with _MODEL_CACHE_LOCK:
+            cached = _MODEL_CACHE.get(cache_key)
+            if cached is not None:
+                if self.config.show_details:
+                    logger.info("Reusing loaded WhisperModel (%s)", model_name)
+                return cached
+            # Release models this configuration no longer uses before loading.
+            wanted = {self.config.whisper_model, self.config.cascade_model}
+            for key in [k for k in _MODEL_CACHE if k[0] not in wanted or k[1:] != settings]:
+                del _MODEL_CACHE[key]
+            model = self._load_whisper(model_name, device, compute_type, cpu_threads, num_workers)
+            _MODEL_CACHE[cache_key] = model
+            return model
+
+    def _load_whisper(self, model_name, device, compute_type, cpu_threads, num_workers):
         stop = threading.Event()
 
         def _progress():
@@ -151,10 +284,11 @@ class MKVLanguageDetector:
 
         try:
             model = WhisperModel(
-                self.config.whisper_model,
+                model_name,
                 device=device,
                 compute_type=compute_type,
                 cpu_threads=cpu_threads,
+                num_workers=num_workers,
                 download_root=None,
                 local_files_only=False,
             )
@@ -164,11 +298,11 @@ class MKVLanguageDetector:
         except Exception as exc:
             logger.warning("Primary init failed (%s), falling back to CPU", exc)
             try:
-                model = WhisperModel(self.config.whisper_model, device="cpu")
+                model = WhisperModel(model_name, device="cpu")
                 logger.info("✓ Fallback (CPU) initialisation successful")
                 return model
             except Exception as fb_exc:
-                raise RuntimeError(f"Failed to initialise Whisper: {fb_exc}") from fb_exc
+                raise ModelLoadError(f"Failed to initialise Whisper: {fb_exc}") from fb_exc
         finally:
             stop.set()
 
@@ -176,18 +310,14 @@ class MKVLanguageDetector:
     def _determine_device(self):
         if self.config.device != "auto":
             return self.config.device
-        try:
-            import torch
-            if torch.cuda.is_available():
-                return "cuda"
-        except ImportError:
-            pass
-        return "cpu"
+        return "cuda" if cuda_available() else "cpu"
 
     def _determine_compute_type(self, device):
         if self.config.compute_type != "auto":
             return self.config.compute_type
-        return "float16" if device == "cuda" else "int8"
+        # int8 weights halve model memory with no measurable effect on
+        # language ID; on CUDA activations stay float16.
+        return "int8_float16" if device == "cuda" else "int8"
 
     # ── Unified directory scan ───────────────────────────────────────────
     def _scan_tree(self, directory: str) -> tuple[list[Path], list[Path], int, int, int, int]:
@@ -252,7 +382,7 @@ class MKVLanguageDetector:
             print(f"Scanning directory tree: {directory}", flush=True)
 
         try:
-            for dirpath, dirnames, filenames in os.walk(directory, followlinks=False):
+            for dirpath, filenames in walk_files(directory):
                 dirs_scanned += 1
 
                 for filename in filenames:
@@ -333,6 +463,11 @@ class MKVLanguageDetector:
         # Stash the seen-set so prune_missing_files can skip redundant I/O.
         self._last_scan_seen_paths = seen_paths
 
+        # walk_files yields directories in completion order; sort so the
+        # processing order, checkpoints and logs are the same every run.
+        video_files.sort()
+        sub_files.sort()
+
         if self.config.show_details:
             logger.info(
                 "Scan complete: %d dirs, %d new videos (%d skipped), "
@@ -376,21 +511,21 @@ class MKVLanguageDetector:
             for strat in strategies:
                 try:
                     limited = limit_subprocess_resources(strat["args"])
-                    subprocess.run(limited, check=True, capture_output=True,
-                                   text=True, encoding="utf-8", errors="replace")
-                    if mkv_path.exists() and mkv_path.stat().st_size > 10_000:
-                        verify = [self.ffprobe, "-v", "quiet", "-print_format", "json",
-                                  "-show_streams", str(mkv_path)]
-                        vr = subprocess.run(verify, check=True, capture_output=True,
-                                            text=True, encoding="utf-8", errors="replace")
-                        json.loads(vr.stdout)
+                    subprocess.run(limited, check=True, stdout=subprocess.DEVNULL,
+                                   stderr=subprocess.PIPE)
+                    # A zero exit status means the matroska muxer finalised
+                    # the file; size and magic only catch a silent no-op.
+                    if (mkv_path.exists() and mkv_path.stat().st_size > 10_000
+                            and _has_ebml_header(mkv_path)):
                         if self.config.show_details:
                             logger.info("Remuxed with strategy '%s'", strat["name"])
                         else:
                             print(f"Successfully remuxed to: {mkv_path.name}")
                         self._remove_original(file_path, mkv_path)
                         return mkv_path
-                except (subprocess.CalledProcessError, json.JSONDecodeError):
+                    if mkv_path.exists():
+                        mkv_path.unlink()
+                except subprocess.CalledProcessError:
                     if mkv_path.exists():
                         mkv_path.unlink()
             logger.error("All remux strategies failed for %s", file_path)
@@ -402,18 +537,20 @@ class MKVLanguageDetector:
             return None
 
     def _remove_original(self, original: Path, mkv: Path):
+        # ffmpeg has exited by the time we get here, so the first unlink
+        # normally succeeds.  Only Windows refuses to delete a file that
+        # a scanner/indexer briefly holds open, so only it gets a backoff.
+        retry_delays = (0.05, 0.1, 0.2, 0.5, 1.0, 2.0) if sys.platform == "win32" else ()
         try:
-            gc.collect()
-            time.sleep(2)
-            for attempt in range(3):
+            for attempt in range(len(retry_delays) + 1):
                 try:
                     original.unlink()
                     if self.config.show_details:
                         logger.info("Removed original: %s", original.name)
                     return
                 except (OSError, PermissionError) as exc:
-                    if attempt < 2:
-                        time.sleep(1.0 * (attempt + 1))
+                    if attempt < len(retry_delays):
+                        time.sleep(retry_delays[attempt])
                     else:
                         raise exc
         except Exception as exc:
@@ -426,33 +563,30 @@ class MKVLanguageDetector:
 
     def _build_remux_strategies(self, src: Path, dst: Path) -> list[dict]:
         """Return a list of ffmpeg remux strategies to try in order."""
-        try:
-            ar = subprocess.run(
-                [self.ffprobe, "-v", "quiet", "-print_format", "json",
-                 "-show_streams", str(src)],
-                check=True, capture_output=True, text=True,
-                encoding="utf-8", errors="replace",
-            )
-            streams = json.loads(ar.stdout).get("streams", [])
-        except Exception:
-            streams = []
+        info = self._get_mkv_info_pyav(src) or self._get_mkv_info_ffprobe(src)
+        streams = info.get("streams", [])
 
         is_m2ts = src.suffix.lower() in (".m2ts", ".mts", ".ts")
         has_pcm = any(s.get("codec_name") == "pcm_bluray"
                       for s in streams if s.get("codec_type") == "audio")
 
         map_args: list[str] = []
-        supported_sub = {
-            "subrip", "srt", "ass", "ssa", "webvtt", "mov_text",
-            "pgs", "dvdsub", "dvbsub", "hdmv_pgs_subtitle",
-        }
+        # Blu-ray LPCM cannot be stored in Matroska as-is; every copy
+        # strategy would fail on it, so transcode it losslessly instead.
+        codec_args: list[str] = ["-c:a", "flac"] if has_pcm else []
+        sub_out = 0
         for i, s in enumerate(streams):
             ct = s.get("codec_type", "")
             cn = s.get("codec_name", "").lower()
             if ct in ("video", "audio"):
                 map_args += ["-map", f"0:{i}"]
-            elif ct == "subtitle" and cn in supported_sub:
+            elif ct == "subtitle" and cn in _REMUX_SUBTITLE_CODECS:
                 map_args += ["-map", f"0:{i}"]
+                # Matroska cannot hold MP4 timed text; convert it up front
+                # rather than letting the copy fail and dropping all subs.
+                if cn == "mov_text":
+                    codec_args += [f"-c:s:{sub_out}", "srt"]
+                sub_out += 1
         if not map_args:
             map_args = ["-map", "0:v", "-map", "0:a"]
 
@@ -462,7 +596,7 @@ class MKVLanguageDetector:
             strats.append({
                 "name": "m2ts_optimized",
                 "args": [
-                    self.ffmpeg, "-y", "-v", "warning", "-fflags", "+genpts",
+                    self.ffmpeg, *FFMPEG_BASE_ARGS, "-y", "-v", "warning", "-fflags", "+genpts",
                     "-analyzeduration", "100M", "-probesize", "100M",
                     "-i", str(src),
                     "-map", "0:v", "-c:v", "copy",
@@ -473,63 +607,71 @@ class MKVLanguageDetector:
                 ],
             })
 
-        strats += [
-            {
-                "name": "selective_copy",
-                "args": [
-                    self.ffmpeg, "-y", "-v", "warning", "-fflags", "+genpts",
-                    "-i", str(src), "-c", "copy",
-                ] + map_args + [
-                    "-avoid_negative_ts", "make_zero", "-map_metadata", "0",
-                    str(dst),
-                ],
-            },
-            {
+        strats.append({
+            "name": "selective_copy",
+            "args": [
+                self.ffmpeg, *FFMPEG_BASE_ARGS, "-y", "-v", "warning", "-fflags", "+genpts",
+                "-i", str(src), "-c", "copy",
+            ] + map_args + codec_args + [
+                "-avoid_negative_ts", "make_zero", "-map_metadata", "0",
+                str(dst),
+            ],
+        })
+        # Without mapped subtitles selective_copy already was the
+        # video+audio copy; running it again cannot succeed.
+        if sub_out:
+            strats.append({
                 "name": "no_subtitles",
                 "args": [
-                    self.ffmpeg, "-y", "-v", "warning", "-fflags", "+genpts",
+                    self.ffmpeg, *FFMPEG_BASE_ARGS, "-y", "-v", "warning", "-fflags", "+genpts",
                     "-i", str(src),
                     "-map", "0:v", "-c:v", "copy",
-                    "-map", "0:a", "-c:a", "copy",
+                    "-map", "0:a", "-c:a", "flac" if has_pcm else "copy",
                     "-avoid_negative_ts", "make_zero", "-map_metadata", "0",
                     str(dst),
                 ],
-            },
-            {
+            })
+        if self.config.allow_reencode:
+            strats.append({
                 "name": "force_remux",
                 "args": [
-                    self.ffmpeg, "-y", "-v", "warning",
+                    self.ffmpeg, *FFMPEG_BASE_ARGS, "-y", "-v", "warning",
                     "-i", str(src),
                     "-map", "0:v", "-c:v", "libx264", "-preset", "ultrafast", "-crf", "23",
                     "-map", "0:a", "-c:a", "copy",
                     "-avoid_negative_ts", "make_zero",
                     str(dst),
                 ],
-            },
-        ]
+            })
         return strats
 
     # ── MKV info ─────────────────────────────────────────────────────────
     def get_mkv_info(self, file_path: Path) -> Dict:
         cache_key = str(file_path)
+        try:
+            st = os.stat(cache_key)
+            fingerprint = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            fingerprint = None
         cached = self._mkv_info_cache.get(cache_key)
-        if cached is not None:
-            return cached
+        if cached is not None and fingerprint is not None and cached[0] == fingerprint:
+            return cached[1]
 
-        mkvmerge = find_executable("mkvmerge")
-        if not mkvmerge:
-            info = self._get_mkv_info_ffprobe(file_path)
-        else:
+        info = None
+        if self.mkvmerge:
             try:
-                cmd = [mkvmerge, "-J", str(file_path)]
+                cmd = [self.mkvmerge, "-J", str(file_path)]
                 r = subprocess.run(cmd, capture_output=True, text=True, check=True,
                                    encoding="utf-8", errors="replace")
-                data = json.loads(r.stdout)
+                data = loads_json(r.stdout)
                 info = self._convert_mkvmerge_to_ffprobe(data)
             except Exception:
-                info = self._get_mkv_info_ffprobe(file_path)
+                info = None
+        if info is None:
+            info = self._get_mkv_info_pyav(file_path) or self._get_mkv_info_ffprobe(file_path)
 
-        self._mkv_info_cache[cache_key] = info
+        if fingerprint is not None:
+            self._mkv_info_cache[cache_key] = (fingerprint, info)
         return info
 
     def get_file_duration(self, file_path: Path) -> float:
@@ -576,13 +718,35 @@ class MKVLanguageDetector:
             info["streams"].append(s)
         return info
 
+    def _get_mkv_info_pyav(self, file_path: Path) -> Optional[Dict]:
+        """Enumerate streams through PyAV, shaped like ``ffprobe -show_streams``.
+
+        Avoids an ffprobe spawn plus JSON decode; returns None when PyAV
+        is unavailable or cannot open the file.
+        """
+        try:
+            import av
+        except ImportError:
+            return None
+        try:
+            with av.open(str(file_path)) as container:
+                streams = [_pyav_stream_info(st) for st in container.streams]
+            return {"streams": streams}
+        except Exception as exc:
+            if self.config.show_details:
+                logger.debug("PyAV probe failed for %s: %s", file_path, exc)
+            return None
+
     def _get_mkv_info_ffprobe(self, file_path: Path) -> Dict:
         try:
+            # Only the fields the track finders read; full -show_streams
+            # output is several times larger.
             cmd = [self.ffprobe, "-v", "quiet", "-print_format", "json",
-                   "-show_streams", str(file_path)]
+                   "-show_entries", "stream=index,codec_type,codec_name:stream_tags",
+                   str(file_path)]
             r = subprocess.run(cmd, capture_output=True, text=True, check=True,
                                encoding="utf-8", errors="replace")
-            return json.loads(r.stdout)
+            return loads_json(r.stdout)
         except Exception:
             return {}
 
@@ -593,13 +757,12 @@ class MKVLanguageDetector:
         if cached is not None:
             return cached
 
-        from uldas.constants import LANGUAGE_CODES
         try:
             cmd = [self.ffprobe, "-v", "quiet", "-print_format", "json",
-                   "-show_format", str(file_path)]
+                   "-show_entries", "format_tags", str(file_path)]
             r = subprocess.run(cmd, capture_output=True, text=True, check=True,
                                encoding="utf-8", errors="replace")
-            tags = json.loads(r.stdout).get("format", {}).get("tags", {})
+            tags = loads_json(r.stdout).get("format", {}).get("tags", {})
         except Exception:
             self._format_lang_cache[cache_key] = {}
             return {}
@@ -611,7 +774,7 @@ class MKVLanguageDetector:
                 idx = int(key[3:]) - 1          # IAS1 → audio index 0
             except ValueError:
                 continue
-            code = LANGUAGE_CODES.get(value.lower().strip())
+            code = LANGUAGE_CODES.get(value.strip().casefold())
             if code:
                 result[idx] = normalize_language_code(code)
         self._format_lang_cache[cache_key] = result
@@ -651,30 +814,54 @@ class MKVLanguageDetector:
     def find_all_subtitle_tracks(self, fp): return self._find_tracks(fp, "subtitle", False)
 
     # ── Audio language detection ─────────────────────────────────────────
-    def detect_language_with_retries(self, file_path, track_idx, stream_idx, max_retries=3):
+    def detect_language_with_retries(self, file_path, track_idx, stream_idx, max_retries=3,
+                                     first_sample=None):
         return audio_mod.detect_language_with_retries(
             self.whisper_model, self.ffmpeg, self.ffprobe,
             file_path, track_idx, stream_idx, self.config, max_retries,
+            first_sample=first_sample, cascade_model=self.cascade_model,
+            duration=self.get_file_duration(file_path),
+        )
+
+    def detect_languages_batch(self, samples: List[audio_mod.AudioInput],
+                               batch_size: int = 8) -> List[Tuple[str, float]]:
+        """Language-ID several extracted samples (paths or PCM arrays) in
+        one encoder pass per *batch_size* samples.  Returns
+        ``(whisper_code, probability)`` per input."""
+        return audio_mod.detect_languages_batch(
+            self.whisper_model, samples, batch_size, self.config.show_details,
         )
 
     # ── Audio metadata update ────────────────────────────────────────────
     def update_mkv_language(self, file_path: Path, track_index: int,
                             language_code: str, dry_run: bool = False) -> bool:
+        return self.update_mkv_languages(file_path, {track_index: language_code}, dry_run)
+
+    def update_mkv_languages(self, file_path: Path, updates: Dict[int, str],
+                             dry_run: bool = False) -> bool:
+        """Tag several audio tracks (index → language code) in one
+        mkvpropedit run, so the headers are rewritten once per file."""
+        if not updates:
+            return True
         if dry_run:
-            print(f"[DRY RUN] Would update track {track_index} → {language_code}")
+            for track_index, language_code in updates.items():
+                print(f"[DRY RUN] Would update track {track_index} → {language_code}")
             return True
         try:
-            cmd = [
-                self.mkvpropedit, str(file_path),
-                "--edit", f"track:a{track_index + 1}",
-                "--set", f"language={language_code}",
-            ]
-            subprocess.run(cmd, capture_output=True, text=True, check=True)
+            cmd = [self.mkvpropedit, str(file_path)]
+            for track_index, language_code in updates.items():
+                cmd += ["--edit", f"track:a{track_index + 1}",
+                        "--set", f"language={language_code}"]
+            subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                           check=True)
             if self.config.show_details:
-                logger.info("Updated audio track %d → %s", track_index, language_code)
+                for track_index, language_code in updates.items():
+                    logger.info("Updated audio track %d → %s", track_index, language_code)
             return True
         except subprocess.CalledProcessError as exc:
-            logger.error("Error updating %s: %s", file_path, exc)
+            detail = (exc.stderr or b"").decode("utf-8", "replace").strip()
+            logger.error("Error updating %s: %s%s", file_path, exc,
+                         f" ({detail})" if detail else "")
             return False
 
     # ── Subtitle processing (embedded) ───────────────────────────────────
@@ -752,6 +939,8 @@ class MKVLanguageDetector:
                     })
                 else:
                     results["failed_subtitle_tracks"].append(sub_idx)
+            except ModelLoadError:
+                raise
             except Exception as exc:
                 logger.error("Error processing subtitle track %d: %s", sub_idx, exc)
                 results["failed_subtitle_tracks"].append(sub_idx)
@@ -840,6 +1029,7 @@ class MKVLanguageDetector:
         if subtitle_path.suffix.lower() == ".sup":
             return sub_mod.detect_forced_pgs_subtitles(
                 self.ffprobe, file_path, sub_idx, self.config.show_details,
+                duration=self.get_file_duration(file_path),
             )
 
         subs = sub_mod.parse_srt_file(subtitle_path)
@@ -867,12 +1057,12 @@ class MKVLanguageDetector:
             self.ffmpeg, file_path, 0, stream_idx,
             self.config.operation_timeout_seconds, self.config.show_details,
         )
-        if not full_audio:
+        if full_audio is None:
             return stats["density"] < 5.5 or stats["coverage_percent"] < 37.5
 
         try:
             segments, info = self.whisper_model.transcribe(
-                str(full_audio), language=None, task="transcribe",
+                full_audio, language=None, task="transcribe",
                 beam_size=1, best_of=1, temperature=0.0,
                 vad_filter=True,
                 vad_parameters={"min_speech_duration_ms": 250, "max_speech_duration_s": 30},
@@ -893,11 +1083,10 @@ class MKVLanguageDetector:
 
             pct = (overlap / total_speech * 100) if total_speech > 0 else 0
             return pct < 50
+        except ModelLoadError:
+            raise
         except Exception:
             return stats["density"] < 5.5 or stats["coverage_percent"] < 37.5
-        finally:
-            if full_audio and full_audio.exists():
-                full_audio.unlink()
 
     # ── Process single video file ────────────────────────────────────────
     def process_file(self, file_path: Path, _cached_key: str = None) -> Dict:
@@ -949,6 +1138,7 @@ class MKVLanguageDetector:
         # Remux
         mkv_path = file_path
         original_audio_langs: Dict[int, str] = {}
+        restored_langs = False
         if self.config.remux_to_mkv and file_path.suffix.lower() != ".mkv":
             # Save defined audio language tags — ffmpeg remux can lose them
             orig_info = self.get_mkv_info(file_path)
@@ -983,16 +1173,9 @@ class MKVLanguageDetector:
                 # no longer applies.
                 self._invalidate_file_caches(file_path)
                 # Re-apply any audio language tags that were lost in remux
-                for _aidx, _lang in original_audio_langs.items():
-                    try:
-                        subprocess.run(
-                            [self.mkvpropedit, str(mkv_path),
-                             "--edit", f"track:a{_aidx + 1}",
-                             "--set", f"language={_lang}"],
-                            capture_output=True, text=True, check=True,
-                        )
-                    except (subprocess.CalledProcessError, Exception):
-                        pass
+                restored_langs = self.update_mkv_languages(
+                    mkv_path, original_audio_langs, self.config.dry_run,
+                )
             elif not mkv_path:
                 results["errors"].append("Failed to remux")
                 return results
@@ -1020,51 +1203,94 @@ class MKVLanguageDetector:
             else:
                 tracks = self.find_undefined_audio_tracks(mkv_path)
 
-            # After remux, tracks that were already labeled in the original
-            # file may appear undefined (ffmpeg can lose tags).  Re-apply
-            # the known label directly instead of running detection.
+            # Tracks labeled in the original file keep that label rather
+            # than being re-detected.  The restore above normally wrote it
+            # already; only if that failed is it retried here.  Labels are
+            # collected and written in one mkvpropedit run.
+            label_updates: Dict[int, str] = {}
             if (results["was_remuxed"] and original_audio_langs
                     and not self.config.reprocess_all):
                 genuinely_undefined = []
                 for t in tracks:
                     tidx = t[0]
-                    if tidx in original_audio_langs:
-                        self.update_mkv_language(
-                            mkv_path, tidx,
-                            original_audio_langs[tidx],
-                            self.config.dry_run,
-                        )
-                    else:
+                    if tidx not in original_audio_langs:
                         genuinely_undefined.append(t)
+                    elif not restored_langs:
+                        label_updates[tidx] = original_audio_langs[tidx]
                 tracks = genuinely_undefined
 
             results["undefined_tracks"] = len(tracks)
+            detected = []
             if not tracks:
                 audio_ok = True
             else:
                 failures = False
+                # Titles such as "English 5.1" settle a track without
+                # Whisper; reprocess modes always re-detect from audio.
+                title_codes = {}
+                if not (self.config.reprocess_all or self.config.reprocess_language):
+                    for tidx, stream_info, _, _ in tracks:
+                        code = language_from_track_title(
+                            stream_info.get("tags", {}).get("title", ""))
+                        if code:
+                            title_codes[tidx] = code
+                    if title_codes and self.config.show_details:
+                        logger.info("Language taken from track title for %d track(s)",
+                                    len(title_codes))
+                whisper_tracks = [t[0] for t in tracks if t[0] not in title_codes]
+                # One demux pass serves the first sample of every track.
+                prefetched = {}
+                if len(whisper_tracks) > 1:
+                    prefetched = audio_mod.extract_audio_samples_multi(
+                        self.ffprobe, mkv_path, whisper_tracks,
+                        self.config.show_details,
+                        duration=self.get_file_duration(mkv_path),
+                    )
+                # ...and one encoder batch settles every confident track.
+                batch_codes = {}
+                if prefetched:
+                    try:
+                        batch_codes = audio_mod.detect_confident_languages_batch(
+                            self.whisper_model, prefetched, self.config,
+                        )
+                    except ModelLoadError:
+                        raise
+                    except Exception as exc:
+                        # Each track still gets its own detection below.
+                        logger.error("Batch language detection failed: %s", exc)
+                batch_codes.update(title_codes)
                 for tidx, _, sidx, cur_lang in tracks:
                     _flush_all_logs()
                     try:
-                        code = self.detect_language_with_retries(mkv_path, tidx, sidx)
+                        code = batch_codes.get(tidx)
+                        if code is None:
+                            code = self.detect_language_with_retries(
+                                mkv_path, tidx, sidx,
+                                first_sample=prefetched.pop(tidx, None),
+                            )
                         if not code:
                             results["failed_tracks"].append(tidx)
                             failures = True
                             continue
-                        if self.update_mkv_language(mkv_path, tidx, code, self.config.dry_run):
-                            results["processed_tracks"].append({
-                                "track_index": tidx,
-                                "detected_language": code,
-                                "previous_language": cur_lang,
-                            })
-                        else:
-                            results["failed_tracks"].append(tidx)
-                            failures = True
+                        label_updates[tidx] = code
+                        detected.append({
+                            "track_index": tidx,
+                            "detected_language": code,
+                            "previous_language": cur_lang,
+                        })
+                    except ModelLoadError:
+                        raise
                     except Exception as exc:
                         logger.error("Error on track %d: %s", tidx, exc)
                         results["failed_tracks"].append(tidx)
                         failures = True
                 audio_ok = not failures
+
+            if self.update_mkv_languages(mkv_path, label_updates, self.config.dry_run):
+                results["processed_tracks"].extend(detected)
+            elif detected:
+                results["failed_tracks"].extend(t["track_index"] for t in detected)
+                audio_ok = False
         else:
             audio_ok = True
 
@@ -1086,57 +1312,9 @@ class MKVLanguageDetector:
         # ── Tracking ─────────────────────────────────────────────────────
         if (self.config.use_tracking and hasattr(self, "tracker")
                 and not self.config.dry_run):
-            if self.config.reprocess_language:
-                touched = bool(results["processed_tracks"]
-                               or results["failed_tracks"])
-                if touched:
-                    self._update_tracker_relabel(mkv_path, abs_key,
-                                                 audio_ok, results)
-            else:
-                flags = []
-                if results["was_remuxed"]:
-                    flags.append("remuxed")
-                    # Use remuxed file path as tracking key so the next run
-                    # recognises the .mkv instead of creating a duplicate entry.
-                    old_key = abs_key
-                    abs_key = os.path.abspath(str(mkv_path))
-                    if old_key != abs_key and old_key in self.tracker.data:
-                        del self.tracker.data[old_key]
-                        self.tracker._dirty = True
-                audio_count = 0
-                if results["processed_tracks"]:
-                    # Only flag "audio_labeled" for genuinely undefined tracks,
-                    # not for labels that were merely restored after remux.
-                    genuinely_detected = [
-                        t for t in results["processed_tracks"]
-                        if t["track_index"] not in original_audio_langs
-                    ]
-                    audio_count = len(genuinely_detected)
-                    if audio_count:
-                        flags.append("audio_labeled")
-                    if any(t["detected_language"] == "zxx" for t in results["processed_tracks"]):
-                        flags.append("silent_content")
-                subtitle_count = 0
-                sub_res = results.get("subtitle_results")
-                if sub_res and sub_res.get("processed_subtitle_tracks"):
-                    subtitle_count = len(sub_res["processed_subtitle_tracks"])
-                    flags.append("subtitle_labeled")
-                if not flags:
-                    flags.append("no_action_required")
-                track_details = results["processed_tracks"] or None
-                subtitle_details = None
-                if sub_res and sub_res.get("processed_subtitle_tracks"):
-                    subtitle_details = sub_res["processed_subtitle_tracks"]
-                original_format = file_path.suffix if results["was_remuxed"] else None
-                self.tracker.mark_processed(
-                    mkv_path, audio_ok, subtitle_ok,
-                    key=abs_key, flags=flags,
-                    audio_tracks_labeled=audio_count,
-                    subtitle_tracks_labeled=subtitle_count,
-                    track_details=track_details,
-                    subtitle_details=subtitle_details,
-                    original_format=original_format,
-                )
+            with self._state_lock:
+                self._record_tracking(file_path, mkv_path, abs_key, audio_ok,
+                                      subtitle_ok, original_audio_langs, results)
 
         # ── Language index (incremental) ────────────────────────────────
         if not self.config.dry_run and hasattr(self, "language_index"):
@@ -1164,6 +1342,65 @@ class MKVLanguageDetector:
 
         return results
 
+    # ── Tracker update for one processed file ────────────────────────────
+    def _record_tracking(self, file_path: Path, mkv_path: Path, abs_key: str,
+                         audio_ok: bool, subtitle_ok: bool,
+                         original_audio_langs: Dict[int, str],
+                         results: Dict) -> None:
+        """Write the outcome of one process_file() call into the tracker.
+        Caller holds ``_state_lock``."""
+        if self.config.reprocess_language:
+            touched = bool(results["processed_tracks"]
+                           or results["failed_tracks"])
+            if touched:
+                self._update_tracker_relabel(mkv_path, abs_key,
+                                             audio_ok, results)
+        else:
+            flags = []
+            if results["was_remuxed"]:
+                flags.append("remuxed")
+                # Use remuxed file path as tracking key so the next run
+                # recognises the .mkv instead of creating a duplicate entry.
+                old_key = abs_key
+                abs_key = os.path.abspath(str(mkv_path))
+                if old_key != abs_key and old_key in self.tracker.data:
+                    del self.tracker.data[old_key]
+                    self.tracker._dirty = True
+            audio_count = 0
+            if results["processed_tracks"]:
+                # Only flag "audio_labeled" for genuinely undefined tracks,
+                # not for labels that were merely restored after remux.
+                genuinely_detected = [
+                    t for t in results["processed_tracks"]
+                    if t["track_index"] not in original_audio_langs
+                ]
+                audio_count = len(genuinely_detected)
+                if audio_count:
+                    flags.append("audio_labeled")
+                if any(t["detected_language"] == "zxx" for t in results["processed_tracks"]):
+                    flags.append("silent_content")
+            subtitle_count = 0
+            sub_res = results.get("subtitle_results")
+            if sub_res and sub_res.get("processed_subtitle_tracks"):
+                subtitle_count = len(sub_res["processed_subtitle_tracks"])
+                flags.append("subtitle_labeled")
+            if not flags:
+                flags.append("no_action_required")
+            track_details = results["processed_tracks"] or None
+            subtitle_details = None
+            if sub_res and sub_res.get("processed_subtitle_tracks"):
+                subtitle_details = sub_res["processed_subtitle_tracks"]
+            original_format = file_path.suffix if results["was_remuxed"] else None
+            self.tracker.mark_processed(
+                mkv_path, audio_ok, subtitle_ok,
+                key=abs_key, flags=flags,
+                audio_tracks_labeled=audio_count,
+                subtitle_tracks_labeled=subtitle_count,
+                track_details=track_details,
+                subtitle_details=subtitle_details,
+                original_format=original_format,
+            )
+
     # ── Tracker update for the by-language reprocess mode ────────────────
     def _update_tracker_relabel(self, mkv_path: Path, abs_key: str,
                                 audio_ok: bool, results: Dict) -> None:
@@ -1398,39 +1635,101 @@ class MKVLanguageDetector:
             return results
 
         action_total = len(actionable)
+        max_workers = max(1, int(self.config.max_workers or 1))
+        if max_workers > 1 and action_total > 1:
+            results.extend(self._process_video_files_concurrently(
+                actionable, key_cache, max_workers,
+            ))
+            return results
+
         checkpoint_every = 25  # flush tracker to disk every N files
         for action_idx, fp in enumerate(actionable, 1):
             if self._should_cancel():
                 break
-            try:
-                if self.config.show_details:
-                    logger.info("[%d/%d] Processing: %s",
-                                action_idx, action_total, fp.name)
-                else:
-                    print(f"[{action_idx}/{action_total}] Processing: {fp.name}")
-
-                cached_key = key_cache.get(str(fp))
-                results.append(self.process_file(fp, _cached_key=cached_key))
-            except Exception as exc:
-                logger.error("Error processing %s: %s", fp, exc)
-                results.append({
-                    "original_file": str(fp), "mkv_file": None,
-                    "was_remuxed": False, "undefined_tracks": 0,
-                    "processed_tracks": [], "failed_tracks": [],
-                    "errors": [str(exc)],
-                    "subtitle_results": None,
-                    "external_subtitle_results": None,
-                    "skipped_due_to_tracking": False,
-                })
-
+            results.append(self._process_one_video(
+                fp, action_idx, action_total, key_cache,
+            ))
             if action_idx % checkpoint_every == 0:
-                if self.config.use_tracking and hasattr(self, "tracker"):
-                    self.tracker.save_if_dirty()
-                if hasattr(self, "language_index"):
-                    self.language_index.save_if_dirty()
+                self._save_checkpoint()
 
         return results
 
+    def _process_one_video(self, fp: Path, action_idx: int, action_total: int,
+                           key_cache: dict[str, str]) -> Dict:
+        """process_file() wrapper that reports progress and raises only
+        ModelLoadError."""
+        try:
+            if self.config.show_details:
+                logger.info("[%d/%d] Processing: %s",
+                            action_idx, action_total, fp.name)
+            else:
+                print(f"[{action_idx}/{action_total}] Processing: {fp.name}")
+
+            cached_key = key_cache.get(str(fp))
+            return self.process_file(fp, _cached_key=cached_key)
+        except ModelLoadError:
+            raise
+        except Exception as exc:
+            logger.error("Error processing %s: %s", fp, exc)
+            return {
+                "original_file": str(fp), "mkv_file": None,
+                "was_remuxed": False, "undefined_tracks": 0,
+                "processed_tracks": [], "failed_tracks": [],
+                "errors": [str(exc)],
+                "subtitle_results": None,
+                "external_subtitle_results": None,
+                "skipped_due_to_tracking": False,
+            }
+
+    def _process_video_files_concurrently(self, actionable: List[Path],
+                                          key_cache: dict[str, str],
+                                          max_workers: int) -> List[Dict]:
+        """Run process_file() over *actionable* on a bounded thread pool.
+
+        ffmpeg/mkvtoolnix run as child processes and CTranslate2 releases
+        the GIL during inference, so threads overlap extraction, Whisper
+        and metadata writes while sharing a single loaded model.  Files
+        are submitted lazily so a cancel request stops new work promptly.
+        Results are returned in input order.
+        """
+        action_total = len(actionable)
+        checkpoint_every = 25
+        ordered: Dict[int, Dict] = {}
+        in_flight: Dict[Future, int] = {}
+        queue = iter(enumerate(actionable, 1))
+
+        if self.config.show_details:
+            logger.info("Processing %d files with %d workers", action_total, max_workers)
+
+        with ThreadPoolExecutor(max_workers=max_workers,
+                                thread_name_prefix="uldas-file") as pool:
+            while True:
+                while len(in_flight) < max_workers and not self._should_cancel():
+                    item = next(queue, None)
+                    if item is None:
+                        break
+                    action_idx, fp = item
+                    future = pool.submit(self._process_one_video, fp,
+                                         action_idx, action_total, key_cache)
+                    in_flight[future] = action_idx
+                if not in_flight:
+                    break
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    ordered[in_flight.pop(future)] = future.result()
+                    if len(ordered) % checkpoint_every == 0:
+                        self._save_checkpoint()
+
+        return [ordered[i] for i in sorted(ordered)]
+
+    def _save_checkpoint(self) -> None:
+        """Flush tracker and language index to disk mid-run."""
+        if self.config.use_tracking and hasattr(self, "tracker"):
+            with self._state_lock:
+                self.tracker.save_if_dirty()
+        if hasattr(self, "language_index"):
+            self.language_index.save_if_dirty()
+
     def _process_ext_sub_files(self, ext_sub_files: List[Path]) -> List[Dict]:
         """Process a list of external subtitle files."""
         results = []
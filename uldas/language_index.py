@@ -15,7 +15,7 @@ from uldas.constants import (
 )
 from uldas import external_subtitles as ext_sub_mod
 from uldas.tools import find_executable
-from uldas.utils import normalize_language_code
+from uldas.utils import loads_json, normalize_language_code
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +34,7 @@ def _probe_track_langs(ffprobe: str, file_path: Path,
                 capture_output=True, text=True, check=True,
                 encoding="utf-8", errors="replace",
             )
-            data = json.loads(r.stdout) or {}
+            data = loads_json(r.stdout) or {}
             audio: list[str] = []
             subs: list[str] = []
             for track in data.get("tracks") or []:
@@ -64,7 +64,7 @@ def _probe_track_langs(ffprobe: str, file_path: Path,
             cmd, capture_output=True, text=True, check=True,
             encoding="utf-8", errors="replace",
         )
-        streams = json.loads(r.stdout).get("streams", []) or []
+        streams = loads_json(r.stdout).get("streams", []) or []
     except (subprocess.CalledProcessError, json.JSONDecodeError, OSError):
         return [], []
 
@@ -404,7 +404,7 @@ def build_language_index(
     video_exts: set = {".mkv"}
     if include_non_mkv_video:
         video_exts.update(VIDEO_EXTENSIONS)
-    sub_exts: set = EXTERNAL_SUBTITLE_EXTENSIONS
+    sub_exts: frozenset = EXTERNAL_SUBTITLE_EXTENSIONS
 
     # Lowercase the ignore-tag list once so we can match against the
     # filename stem case-insensitively in the inner loop.
@@ -5,15 +5,17 @@ import os
 import sys
 import time
 import signal
+import shutil
 import tempfile
 import logging
+from typing import Optional
 
 from uldas.constants import VERSION
 from uldas.config import Config
 from uldas.logging_setup import setup_logging
 from uldas.tools import find_executable, find_mkvtoolnix_installation
 from uldas.tracking import ProcessingTracker
-from uldas.updater import check_for_updates
+from uldas.updater import check_for_updates, report_update_check
 from uldas.summary import print_detailed_summary
 from uldas.scheduler_state import SchedulerState
 
@@ -61,6 +63,20 @@ def _tune_third_party_logging(show_details: bool) -> None:
     )
 
 
+_SHM_DIR = "/dev/shm"
+_SHM_MIN_FREE_BYTES = 512 * 1024 ** 2
+
+
+def _shm_has_room() -> bool:
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        return (os.access(_SHM_DIR, os.W_OK)
+                and shutil.disk_usage(_SHM_DIR).free >= _SHM_MIN_FREE_BYTES)
+    except OSError:
+        return False
+
+
 def _apply_temp_dir(config: Config) -> None:
     """Override the global tempfile directory if configured."""
     temp_dir = config.temp_dir
@@ -70,6 +86,12 @@ def _apply_temp_dir(config: Config) -> None:
         os.makedirs(temp_dir, exist_ok=True)
         tempfile.tempdir = temp_dir
         logger.info("Temporary directory set to: %s", temp_dir)
+    elif _shm_has_room():
+        # Audio never touches disk; what remains is subtitle scratch
+        # (extracted .srt/.sup tracks, OCR frame images), short-lived and
+        # at most a few hundred MB, so keep it in RAM-backed storage.
+        tempfile.tempdir = _SHM_DIR
+        logger.debug("Using RAM-backed temporary directory: %s", _SHM_DIR)
     else:
         logger.debug("Using default temporary directory: %s", tempfile.gettempdir())
 
@@ -102,12 +124,19 @@ def _build_parser() -> argparse.ArgumentParser:
                    help="Remux non-MKV video files to MKV before processing (config: remux_to_mkv)")
     p.add_argument("--no-remux-to-mkv", action="store_true", default=None,
                    help="Disable remuxing non-MKV files to MKV")
+    p.add_argument("--allow-reencode", action="store_true", default=None,
+                   help="Re-encode video when every copy-only remux fails (default) (config: allow_reencode)")
+    p.add_argument("--no-allow-reencode", action="store_true", default=None,
+                   help="Never re-encode video while remuxing; give up instead")
     p.add_argument("--show-details", action="store_true", default=None,
                    help="Show detailed processing information (config: show_details)")
     p.add_argument("--no-show-details", action="store_true", default=None,
                    help="Hide detailed processing information")
-    p.add_argument("--model", choices=["tiny", "base", "small", "medium", "large"],
+    p.add_argument("--model", choices=["tiny", "base", "small", "medium", "large", "turbo"],
                    help="Whisper model size (config: whisper_model)")
+    p.add_argument("--cascade-model", choices=["tiny", "base", "small", "medium", "large"],
+                   help="Smaller model tried first; the main model only runs when it is "
+                        "unsure (config: cascade_model)")
     p.add_argument("--dry-run", action="store_true", default=None,
                    help="Simulate changes without modifying any files (config: dry_run)")
     p.add_argument("--temp-dir", metavar="DIR",
@@ -122,15 +151,22 @@ def _build_parser() -> argparse.ArgumentParser:
                    help="Minimum speech duration in ms for VAD (config: vad_min_speech_duration_ms)")
     p.add_argument("--vad-max-speech-duration-s", type=int, metavar="S",
                    help="Maximum speech duration in seconds for VAD (config: vad_max_speech_duration_s)")
+    p.add_argument("--no-audio-filter", action="store_true", default=None,
+                   help="Disable the speech clean-up filters on retry samples (config: audio_filter)")
+    p.add_argument("--audio-filter", action="store_true", default=None,
+                   help="Enable the speech clean-up filters on retry samples (default)")
 
     # ── Device / compute ─────────────────────────────────────────────────
     p.add_argument("--device", choices=["auto", "cpu", "cuda"],
                    help="Device for Whisper inference (config: device)")
     p.add_argument("--compute-type",
-                   choices=["auto", "int8", "int8_float16", "int16", "float16", "float32"],
+                   choices=["auto", "int8", "int8_float16", "int8_bfloat16", "int16",
+                            "float16", "bfloat16", "float32"],
                    help="Compute type for Whisper inference (config: compute_type)")
     p.add_argument("--cpu-threads", type=int, metavar="N",
                    help="Number of CPU threads (0 = auto) (config: cpu_threads)")
+    p.add_argument("--max-workers", type=int, metavar="N",
+                   help="Number of video files processed concurrently (config: max_workers)")
 
     # ── Confidence / reprocessing ────────────────────────────────────────
     p.add_argument("--confidence-threshold", type=float, metavar="F",
@@ -218,6 +254,11 @@ def _apply_cli_overrides(config: Config, args) -> None:
     elif args.no_remux_to_mkv:
         config.remux_to_mkv = False
 
+    if args.allow_reencode:
+        config.allow_reencode = True
+    elif args.no_allow_reencode:
+        config.allow_reencode = False
+
     if args.show_details:
         config.show_details = True
     elif args.no_show_details:
@@ -226,6 +267,9 @@ def _apply_cli_overrides(config: Config, args) -> None:
     if args.model:
         config.whisper_model = args.model
 
+    if args.cascade_model:
+        config.cascade_model = args.cascade_model
+
     if args.dry_run:
         config.dry_run = True
 
@@ -238,6 +282,11 @@ def _apply_cli_overrides(config: Config, args) -> None:
     elif args.vad:
         config.vad_filter = True
 
+    if args.no_audio_filter:
+        config.audio_filter = False
+    elif args.audio_filter:
+        config.audio_filter = True
+
     if args.vad_min_speech_duration_ms is not None:
         config.vad_min_speech_duration_ms = args.vad_min_speech_duration_ms
 
@@ -254,6 +303,9 @@ def _apply_cli_overrides(config: Config, args) -> None:
     if args.cpu_threads is not None:
         config.cpu_threads = args.cpu_threads
 
+    if args.max_workers is not None:
+        config.max_workers = args.max_workers
+
     # ── Confidence / reprocessing ────────────────────────────────────────
     if args.confidence_threshold is not None:
         config.confidence_threshold = args.confidence_threshold
@@ -494,12 +546,20 @@ def _try_reprocess_language_fast_path(detector, config: Config,
 
 
 def _run_processing(config: Config, skip_update_check: bool = False,
-                    state: "Optional[SchedulerState]" = None,
+                    state: Optional[SchedulerState] = None,
                     config_path: str = "config/config.yml") -> None:
-    start = time.time()
-
     if not skip_update_check:
         check_for_updates()
+    try:
+        _process_run(config, state, config_path)
+    finally:
+        # A startup update check that outlived its short wait reports here.
+        report_update_check()
+
+
+def _process_run(config: Config, state: Optional[SchedulerState],
+                 config_path: str) -> None:
+    start = time.time()
 
     # Reload config from disk so web UI settings changes take effect
     config.load_from_file(config_path)
@@ -616,13 +676,9 @@ def _run_processing(config: Config, skip_update_check: bool = False,
         sys.exit(1)
 
     # Import detector here (heavy import due to Whisper)
-    from uldas.detector import MKVLanguageDetector
+    from uldas.detector import MKVLanguageDetector, ModelLoadError
 
     try:
-        if config.show_details:
-            logger.info("Loading faster-whisper model: %s", config.whisper_model)
-        else:
-            print(f"Loading faster-whisper model: {config.whisper_model}")
         cancel_check = state.is_stopped if state is not None else None
         detector = MKVLanguageDetector(config, cancel_check=cancel_check)
     except RuntimeError as exc:
@@ -670,6 +726,15 @@ def _run_processing(config: Config, skip_update_check: bool = False,
             except Exception:
                 logger.debug("Reprocess discrepancy check failed",
                              exc_info=True)
+    except ModelLoadError as exc:
+        # The model loads on first use, so a bad name or failed download
+        # surfaces here rather than when the detector is built.
+        msg = f"Failed to initialise detector: {exc}"
+        logger.error(msg)
+        if state is not None:
+            state.set_status("error", msg)
+            return
+        sys.exit(1)
     finally:
         # Final flush of batched tracker writes, even on exception.
         if config.use_tracking and hasattr(detector, "tracker"):
@@ -10,6 +10,7 @@ import logging
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple
 
+from uldas.constants import FFMPEG_BASE_ARGS
 from uldas.utils import (
     limit_subprocess_resources,
     convert_iso639_1_to_2,
@@ -74,15 +75,15 @@ def extract_subtitle_track(
         for mapping in mappings:
             try:
                 cmd = [
-                    ffmpeg, "-y", "-v", "warning",
+                    ffmpeg, *FFMPEG_BASE_ARGS, "-y", "-v", "warning",
                     "-i", str(file_path),
                     "-map", mapping,
                     "-c:s", copy_codec,
                     str(tmp_path),
                 ]
                 limited = limit_subprocess_resources(cmd)
-                subprocess.run(limited, check=True, capture_output=True,
-                               text=True, encoding="utf-8", errors="replace")
+                subprocess.run(limited, check=True, stdout=subprocess.DEVNULL,
+                               stderr=subprocess.PIPE)
                 if tmp_path.exists() and tmp_path.stat().st_size > 100:
                     return tmp_path
                 if tmp_path.exists():
@@ -297,8 +298,8 @@ def _extract_pgs_images_and_ocr(
         for method_cmd in _pgs_extraction_commands(ffmpeg, file_path, subtitle_track_index, tmp_dir):
             try:
                 limited = limit_subprocess_resources(method_cmd)
-                subprocess.run(limited, capture_output=True, text=True,
-                               encoding="utf-8", errors="replace", timeout=120)
+                subprocess.run(limited, stdout=subprocess.DEVNULL,
+                               stderr=subprocess.PIPE, timeout=120)
             except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
                 pass
             image_files = list(Path(tmp_dir).glob("sub_*.png"))
@@ -352,7 +353,7 @@ def _extract_pgs_images_and_ocr(
 def _pgs_extraction_commands(ffmpeg, file_path, sub_idx, tmp_dir):
     """Yield ffmpeg commands to try for PGS image extraction."""
     yield [
-        ffmpeg, "-y", "-v", "warning",
+        ffmpeg, *FFMPEG_BASE_ARGS, "-y", "-v", "warning",
         "-i", str(file_path),
         "-filter_complex", f"[0:s:{sub_idx}]scale=iw:ih[sub]",
         "-map", "[sub]", "-frames:v", "50", "-vsync", "0",
@@ -361,19 +362,19 @@ def _pgs_extraction_commands(ffmpeg, file_path, sub_idx, tmp_dir):
     # Method 2: extract .sup then convert
     sup = os.path.join(tmp_dir, "subtitles.sup")
     yield [
-        ffmpeg, "-y", "-v", "warning",
+        ffmpeg, *FFMPEG_BASE_ARGS, "-y", "-v", "warning",
         "-i", str(file_path),
         "-map", f"0:s:{sub_idx}", "-c", "copy", sup,
     ]
     # (if sup exists, caller will re-glob)
     yield [
-        ffmpeg, "-y", "-v", "warning",
+        ffmpeg, *FFMPEG_BASE_ARGS, "-y", "-v", "warning",
         "-i", sup, "-frames:v", "50", "-vsync", "0",
         f"{tmp_dir}/sub_%04d.png",
     ]
     # Method 3: overlay
     yield [
-        ffmpeg, "-y", "-v", "warning",
+        ffmpeg, *FFMPEG_BASE_ARGS, "-y", "-v", "warning",
         "-i", str(file_path),
         "-filter_complex", f"[0:v][0:s:{sub_idx}]overlay[v]",
         "-map", "[v]", "-frames:v", "50", "-vsync", "0", "-q:v", "2",
@@ -482,11 +483,13 @@ def detect_forced_pgs_subtitles(
     file_path: Path,
     subtitle_track_index: int,
     show_details: bool = False,
+    duration: Optional[float] = None,
 ) -> bool:
     """Heuristic forced detection for PGS subtitles based on frame count."""
     try:
-        from uldas.audio import _get_file_duration
-        duration = _get_file_duration(ffprobe, file_path, show_details)
+        if duration is None:
+            from uldas.audio import _get_file_duration
+            duration = _get_file_duration(ffprobe, file_path, show_details)
         if duration <= 0:
             return False
 
@@ -615,11 +618,14 @@ def update_subtitle_metadata(
             "--set", f"name={track_name}",
             "--set", f"flag-forced={'1' if is_forced else '0'}",
         ]
-        subprocess.run(cmd, capture_output=True, text=True, check=True)
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                       check=True)
         if show_details:
             logger.info("Updated subtitle track %d: lang=%s name='%s'",
                         track_index, language_code, track_name)
         return True
     except subprocess.CalledProcessError as exc:
-        logger.error("Error updating subtitle metadata: %s", exc)
+        detail = (exc.stderr or b"").decode("utf-8", "replace").strip()
+        logger.error("Error updating subtitle metadata: %s%s", exc,
+                     f" ({detail})" if detail else "")
         return False
\ No newline at end of file
@@ -1,4 +1,5 @@
 #file: uldas/summary.py
+import sys
 from pathlib import Path
 from typing import List, Dict, Optional
 
@@ -22,6 +23,10 @@ def print_detailed_summary(
     total_ext_subs_found: int = 0,
     total_new_ext_subs: int = 0,
 ) -> None:
+    # Collected and written in one go rather than line by line; console
+    # writes are slow, notably on Windows.
+    lines: List[str] = []
+    write = lines.append
 
     # ── Tracking Statistics (printed first, above everything else) ───────
     if config.use_tracking and detector and hasattr(detector, "tracker"):
@@ -32,18 +37,18 @@ def print_detailed_summary(
         total_count = video_count + ext_sub_count
 
         if total_count:
-            print(f"\n{'=' * 60}")
-            print("TRACKING STATISTICS")
-            print(f"{'=' * 60}")
-            print(f"  Video files tracked: {video_count}")
+            write(f"\n{'=' * 60}")
+            write("TRACKING STATISTICS")
+            write(f"{'=' * 60}")
+            write(f"  Video files tracked: {video_count}")
             if ext_sub_count:
-                print(f"  External subtitles tracked: {ext_sub_count}")
-            print(f"  Total entries tracked: {total_count}")
+                write(f"  External subtitles tracked: {ext_sub_count}")
+            write(f"  Total entries tracked: {total_count}")
 
     # ── Audio Processing Summary ─────────────────────────────────────────
-    print(f"\n{'=' * 60}")
-    print("AUDIO PROCESSING SUMMARY")
-    print(f"{'=' * 60}")
+    write(f"\n{'=' * 60}")
+    write("AUDIO PROCESSING SUMMARY")
+    write(f"{'=' * 60}")
 
     total = len(video_results)
     acted = success = failed = processed = skipped = 0
@@ -62,7 +67,9 @@ def print_detailed_summary(
         if r["was_remuxed"]:
             actions.append("remuxed")
 
-        for t in sorted(r["processed_tracks"], key=lambda x: x["track_index"]):
+        # process_file appends processed tracks in stream order.  Failed
+        # ones are not: a failed tag write adds them after earlier failures.
+        for t in r["processed_tracks"]:
             idx, lang, prev = t["track_index"], t["detected_language"], t.get("previous_language", "und")
             prev_fmt = f"{prev} (no speech)" if prev == "zxx" else prev
             lang_fmt = f"{lang} (no speech)" if lang == "zxx" else lang
@@ -82,7 +89,7 @@ def print_detailed_summary(
             has_fail = True
 
         if actions:
-            print(f"{name}: {', '.join(actions)}")
+            write(f"{name}: {', '.join(actions)}")
             acted += 1
             processed += 1
             if has_fail:
@@ -92,41 +99,41 @@ def print_detailed_summary(
             if has_silent:
                 silent_files.append(name)
         elif r["errors"]:
-            print(f"{name}: {RED}error{RESET} – {r['errors'][0]}")
+            write(f"{name}: {RED}error{RESET} – {r['errors'][0]}")
             acted += 1
             failed += 1
 
     if skipped:
-        print(f"\n{GREEN}Skipped {skipped} already-processed file(s){RESET}")
+        write(f"\n{GREEN}Skipped {skipped} already-processed file(s){RESET}")
     if acted:
-        print(f"\nShowing {acted} files that required action (out of {total} total)")
+        write(f"\nShowing {acted} files that required action (out of {total} total)")
         parts = []
         if success:
             parts.append(f"Successfully processed {success} files")
         if failed:
             parts.append(f"{RED}{failed} files failed!{RESET}")
         if parts:
-            print(". ".join(parts))
+            write(". ".join(parts))
     else:
-        print("No tracks required any action")
+        write("No tracks required any action")
 
     if silent_files:
-        print(f"\n{YELLOW}⚠️  WARNING: Silent content detected in {len(silent_files)} file(s){RESET}")
+        write(f"\n{YELLOW}⚠️  WARNING: Silent content detected in {len(silent_files)} file(s){RESET}")
         for f in silent_files[:5]:
-            print(f"{YELLOW}   - {f}{RESET}")
+            write(f"{YELLOW}   - {f}{RESET}")
         if len(silent_files) > 5:
-            print(f"{YELLOW}   ... and {len(silent_files) - 5} more{RESET}")
+            write(f"{YELLOW}   ... and {len(silent_files) - 5} more{RESET}")
 
     if detector and detector.deletion_failures:
-        print(f"\n{YELLOW}⚠️  WARNING: {len(detector.deletion_failures)} original file(s) could not be deleted{RESET}")
+        write(f"\n{YELLOW}⚠️  WARNING: {len(detector.deletion_failures)} original file(s) could not be deleted{RESET}")
         for df in detector.deletion_failures:
-            print(f"{YELLOW}   - {Path(df['original_file']).name}{RESET}")
+            write(f"{YELLOW}   - {Path(df['original_file']).name}{RESET}")
 
     # ── Subtitle summary (embedded) ──────────────────────────────────────
     if config.process_subtitles:
-        print(f"\n{'=' * 60}")
-        print("SUBTITLE PROCESSING SUMMARY (EMBEDDED)")
-        print(f"{'=' * 60}")
+        write(f"\n{'=' * 60}")
+        write("SUBTITLE PROCESSING SUMMARY (EMBEDDED)")
+        write(f"{'=' * 60}")
 
         t_found = t_proc = t_fail = t_skip = t_forced = t_sdh = 0
         for r in video_results:
@@ -146,7 +153,7 @@ def print_detailed_summary(
 
             if sr["processed_subtitle_tracks"] or sr["failed_subtitle_tracks"] or sr.get("skipped_subtitle_tracks"):
                 name = Path(r["original_file"]).name
-                print(f"\n{name}:")
+                write(f"\n{name}:")
                 for st in sr["processed_subtitle_tracks"]:
                     flags = []
                     if st.get("is_forced"):
@@ -159,32 +166,32 @@ def print_detailed_summary(
                     conf = st["confidence"]
                     colour = CYAN if prev != lang else ""
                     reset = RESET if colour else ""
-                    print(f"  {colour}subtitle track{st['track_index']}: {prev} -> {lang}{reset} (conf: {conf:.2f}){flag_str}")
+                    write(f"  {colour}subtitle track{st['track_index']}: {prev} -> {lang}{reset} (conf: {conf:.2f}){flag_str}")
                 for st in sr.get("skipped_subtitle_tracks", []):
-                    print(f"  {YELLOW}subtitle track{st['track_index']}: skipped{RESET} "
+                    write(f"  {YELLOW}subtitle track{st['track_index']}: skipped{RESET} "
                           f"(detected: {st['detected_language']}, conf: {st['confidence']:.2f})")
                 for idx in sr["failed_subtitle_tracks"]:
-                    print(f"  {RED}subtitle track{idx}: failed{RESET}")
+                    write(f"  {RED}subtitle track{idx}: failed{RESET}")
 
         if t_found:
-            print(f"\nSubtitle tracks found: {t_found}")
-            print(f"Successfully processed: {t_proc}")
+            write(f"\nSubtitle tracks found: {t_found}")
+            write(f"Successfully processed: {t_proc}")
             if t_skip:
-                print(f"{YELLOW}Skipped (low confidence): {t_skip}{RESET}")
+                write(f"{YELLOW}Skipped (low confidence): {t_skip}{RESET}")
             if t_fail:
-                print(f"{RED}Failed: {t_fail}{RESET}")
+                write(f"{RED}Failed: {t_fail}{RESET}")
             if t_forced:
-                print(f"Forced subtitles detected: {t_forced}")
+                write(f"Forced subtitles detected: {t_forced}")
             if t_sdh:
-                print(f"SDH subtitles detected: {t_sdh}")
+                write(f"SDH subtitles detected: {t_sdh}")
         else:
-            print("\nNo tracks required any action")
+            write("\nNo tracks required any action")
 
     # ── External subtitle summary ────────────────────────────────────────
     if config.process_external_subtitles:
-        print(f"\n{'=' * 60}")
-        print("EXTERNAL SUBTITLE PROCESSING SUMMARY")
-        print(f"{'=' * 60}")
+        write(f"\n{'=' * 60}")
+        write("EXTERNAL SUBTITLE PROCESSING SUMMARY")
+        write(f"{'=' * 60}")
 
         ext_proc = ext_fail = ext_skip = 0
         ext_total = len(ext_sub_results)
@@ -198,33 +205,35 @@ def print_detailed_summary(
                 lang = esr.get("detected_language", "?")
                 conf = esr.get("confidence", 0.0)
                 sdh_tag = f" [{CYAN}SDH{RESET}]" if esr.get("is_sdh") else ""
-                print(f"  {CYAN}{orig_name} → {new_name}{RESET} (lang: {lang}, conf: {conf:.2f}){sdh_tag}")
+                write(f"  {CYAN}{orig_name} → {new_name}{RESET} (lang: {lang}, conf: {conf:.2f}){sdh_tag}")
             elif status == "skipped":
                 ext_skip += 1
                 sub_name = Path(esr["original_file"]).name
                 reason = esr.get("reason", "unknown")
                 lang = esr.get("detected_language", "?")
                 conf = esr.get("confidence", 0.0)
-                print(f"  {YELLOW}{sub_name}: skipped{RESET} "
+                write(f"  {YELLOW}{sub_name}: skipped{RESET} "
                       f"(detected: {lang}, conf: {conf:.2f}, reason: {reason})")
             else:
                 ext_fail += 1
                 sub_name = Path(esr["original_file"]).name
                 reason = esr.get("reason", "unknown")
-                print(f"  {RED}{sub_name}: failed ({reason}){RESET}")
+                write(f"  {RED}{sub_name}: failed ({reason}){RESET}")
 
         new_count = total_new_ext_subs if total_new_ext_subs else ext_total
         if new_count:
-            print(f"\nNew external subtitle files found: {new_count}")
-            print(f"Successfully processed: {ext_proc}")
+            write(f"\nNew external subtitle files found: {new_count}")
+            write(f"Successfully processed: {ext_proc}")
             if ext_skip:
-                print(f"{YELLOW}Skipped: {ext_skip}{RESET}")
+                write(f"{YELLOW}Skipped: {ext_skip}{RESET}")
             if ext_fail:
-                print(f"{RED}Failed: {ext_fail}{RESET}")
+                write(f"{RED}Failed: {ext_fail}{RESET}")
         else:
-            print("\nNo external subtitle files required any action")
+            write("\nNo external subtitle files required any action")
 
-    print(f"\nTotal runtime: {format_duration(runtime_seconds)}")
+    write(f"\nTotal runtime: {format_duration(runtime_seconds)}")
     if config.dry_run:
-        print("(Dry run – no files were actually modified)")
-    print()
\ No newline at end of file
+        write("(Dry run – no files were actually modified)")
+    write("")
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
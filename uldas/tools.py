@@ -2,15 +2,82 @@
 
 import os
 import sys
+import json
 import shutil
 import logging
-from typing import Optional
+from typing import Dict, Optional
 
 logger = logging.getLogger(__name__)
 
+# Resolved tool paths for the life of the process.  Only successful
+# lookups are cached, so a tool installed while the scheduler keeps the
+# process alive is still found on the next run.
+_executable_cache: Dict[str, str] = {}
+
+_MKVTOOLNIX_CACHE_KEY = "<mkvtoolnix-installation>"
+
+# Absolute paths found by the (slow, Windows-only) directory/registry
+# scans are persisted here so later runs skip the scan entirely.
+_TOOL_PATHS_FILE = os.path.join("config", "tool_paths.json")
+_persisted_paths: Optional[Dict[str, str]] = None
+
+
+def _load_persisted_paths() -> Dict[str, str]:
+    global _persisted_paths
+    if _persisted_paths is None:
+        try:
+            with open(_TOOL_PATHS_FILE, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+            _persisted_paths = {k: v for k, v in data.items()
+                                if isinstance(k, str) and isinstance(v, str)}
+        except (OSError, ValueError, AttributeError):
+            _persisted_paths = {}
+    return _persisted_paths
+
+
+def _persist_path(key: str, path: str) -> None:
+    paths = _load_persisted_paths()
+    if paths.get(key) == path:
+        return
+    paths[key] = path
+    try:
+        os.makedirs(os.path.dirname(_TOOL_PATHS_FILE), exist_ok=True)
+        with open(_TOOL_PATHS_FILE, "w", encoding="utf-8") as fh:
+            json.dump(paths, fh, indent=2)
+    except OSError as exc:
+        logger.debug("Could not save tool path cache: %s", exc)
+
+
+def _cached_lookup(key: str) -> Optional[str]:
+    """Return a previously resolved path for *key* if it still exists."""
+    cached = _executable_cache.get(key)
+    if cached is not None:
+        return cached
+    persisted = _load_persisted_paths().get(key)
+    if persisted and os.path.isfile(persisted):
+        _executable_cache[key] = persisted
+        return persisted
+    return None
+
+
+def _remember(key: str, path: str) -> None:
+    _executable_cache[key] = path
+    if os.path.isabs(path):
+        _persist_path(key, path)
+
 
 def find_executable(name: str) -> Optional[str]:
     """Return the path to *name* (or *name*.exe on Windows), or ``None``."""
+    cached = _cached_lookup(name)
+    if cached is not None:
+        return cached
+    path = _locate_executable(name)
+    if path:
+        _remember(name, path)
+    return path
+
+
+def _locate_executable(name: str) -> Optional[str]:
     if shutil.which(name):
         return name
 
@@ -57,16 +124,70 @@ def find_mkvtoolnix_installation() -> Optional[str]:
     if sys.platform != "win32":
         return None
 
+    cached = _cached_lookup(_MKVTOOLNIX_CACHE_KEY)
+    if cached is not None:
+        print(f"mkvpropedit.exe found at: {cached}")
+        return cached
+    exe = _search_mkvtoolnix_installation()
+    if exe:
+        _remember(_MKVTOOLNIX_CACHE_KEY, exe)
+    return exe
+
+
+def _mkvpropedit_from_uninstall_entry(winreg, key) -> Optional[str]:
+    """mkvpropedit.exe under an Uninstall entry's InstallLocation, if any."""
+    try:
+        loc = winreg.QueryValueEx(key, "InstallLocation")[0]
+    except FileNotFoundError:
+        return None
+    print(f"Found MKVToolNix installed at: {loc}")
+    exe = os.path.join(loc, "mkvpropedit.exe")
+    if os.path.exists(exe):
+        print(f"mkvpropedit.exe found at: {exe}")
+        return exe
+    return None
+
+
+def _search_mkvtoolnix_installation() -> Optional[str]:
     print("Searching for MKVToolNix installation...")
 
+    on_path = shutil.which("mkvpropedit.exe")
+    if on_path:
+        print(f"mkvpropedit.exe found at: {on_path}")
+        return on_path
+
     # ── Registry search ──────────────────────────────────────────────────
     try:
         import winreg
 
+        # App Paths entries point straight at the executable; the GUI one
+        # is what the installer registers, and the CLI tools sit beside it.
+        app_paths = r"SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths"
+        for app in ("mkvpropedit.exe", "mkvtoolnix-gui.exe"):
+            try:
+                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, rf"{app_paths}\{app}") as key:
+                    target = winreg.QueryValueEx(key, "")[0]
+            except OSError:
+                continue
+            exe = os.path.join(os.path.dirname(target.strip('"')), "mkvpropedit.exe")
+            if os.path.exists(exe):
+                print(f"mkvpropedit.exe found at: {exe}")
+                return exe
+
         reg_paths = [
             r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall",
             r"SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Uninstall",
         ]
+        # The official installer registers under a fixed key name; open
+        # it directly before enumerating hundreds of Uninstall entries.
+        for rp in reg_paths:
+            try:
+                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, rp + r"\MKVToolNix") as sub:
+                    exe = _mkvpropedit_from_uninstall_entry(winreg, sub)
+                    if exe:
+                        return exe
+            except OSError:
+                continue
         for rp in reg_paths:
             try:
                 with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, rp) as key:
@@ -78,15 +199,9 @@ def find_mkvtoolnix_installation() -> Optional[str]:
                                 try:
                                     display = winreg.QueryValueEx(sub, "DisplayName")[0]
                                     if "mkvtoolnix" in display.lower():
-                                        try:
-                                            loc = winreg.QueryValueEx(sub, "InstallLocation")[0]
-                                            print(f"Found MKVToolNix installed at: {loc}")
-                                            exe = os.path.join(loc, "mkvpropedit.exe")
-                                            if os.path.exists(exe):
-                                                print(f"mkvpropedit.exe found at: {exe}")
-                                                return exe
-                                        except FileNotFoundError:
-                                            pass
+                                        exe = _mkvpropedit_from_uninstall_entry(winreg, sub)
+                                        if exe:
+                                            return exe
                                 except FileNotFoundError:
                                     pass
                             i += 1
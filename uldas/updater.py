@@ -1,6 +1,12 @@
 #file: uldas/updater.py
 
+import json
 import logging
+import os
+import threading
+import time
+from typing import Optional, Tuple
+
 import requests
 from packaging import version as pkg_version
 
@@ -8,47 +14,123 @@ from uldas.constants import VERSION
 
 logger = logging.getLogger(__name__)
 
+_RELEASES_URL = "https://api.github.com/repos/netplexflix/ULDAS/releases/latest"
+_UPDATE_CACHE_FILE = os.path.join("config", "update_check.json")
+_UPDATE_CACHE_TTL = 24 * 3600
+# How long startup waits for the check before leaving it to the
+# background thread.  Cache hits finish well within this.
+_UPDATE_CHECK_WAIT = 0.2
+# How long the end of a run waits for a check still in flight.
+_UPDATE_REPORT_WAIT = 5.0
 
-def check_for_updates() -> None:
+# (worker, outcome) of a check that outlived _UPDATE_CHECK_WAIT.
+_pending_check: Optional[Tuple[threading.Thread, dict]] = None
+
+
+def _fetch_latest_version() -> str:
+    """Return the latest release tag (without ``v``), asking GitHub at
+    most once per ``_UPDATE_CACHE_TTL``.  Network errors propagate."""
     try:
-        print("Checking for updates...", end=" ", flush=True)
-        url = "https://api.github.com/repos/netplexflix/ULDAS/releases/latest"
-        resp = requests.get(url, timeout=5)
-        resp.raise_for_status()
-        latest = resp.json().get("tag_name", "").lstrip("v")
-        if not latest:
-            print("Could not determine latest version")
-            return
+        with open(_UPDATE_CACHE_FILE, "r", encoding="utf-8") as fh:
+            cached = json.load(fh)
+        if time.time() - float(cached["checked_at"]) < _UPDATE_CACHE_TTL:
+            return str(cached["latest"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    resp = requests.get(_RELEASES_URL, timeout=5)
+    resp.raise_for_status()
+    latest = resp.json().get("tag_name", "").lstrip("v")
+    if latest:
         try:
-            if pkg_version.parse(latest) > pkg_version.parse(VERSION):
-                print("UPDATE AVAILABLE!")
-                print(f"\n{'=' * 60}")
-                print("📄 UPDATE AVAILABLE")
-                print(f"{'=' * 60}")
-                print(f"Current version: {VERSION}")
-                print(f"Latest version:  {latest}")
-                print("Download from: https://github.com/netplexflix/ULDAS")
-                print(f"{'=' * 60}\n")
-            else:
-                print(f"✓ Up to date. Version: {VERSION}")
-        except Exception:
-            if latest != VERSION:
-                print(f"Update may be available (current: {VERSION}, latest: {latest})")
-            else:
-                print(f"✓ Up to date. Version: {VERSION}")
-    except requests.exceptions.RequestException:
-        print("Failed (network error)")
+            os.makedirs(os.path.dirname(_UPDATE_CACHE_FILE), exist_ok=True)
+            with open(_UPDATE_CACHE_FILE, "w", encoding="utf-8") as fh:
+                json.dump({"checked_at": time.time(), "latest": latest}, fh)
+        except OSError as exc:
+            logger.debug("Could not save update check cache: %s", exc)
+    return latest
+
+
+def _print_update_status(latest: str) -> None:
+    if not latest:
+        print("Could not determine latest version")
+        return
+    try:
+        if pkg_version.parse(latest) > pkg_version.parse(VERSION):
+            print("UPDATE AVAILABLE!")
+            print(f"\n{'=' * 60}")
+            print("📄 UPDATE AVAILABLE")
+            print(f"{'=' * 60}")
+            print(f"Current version: {VERSION}")
+            print(f"Latest version:  {latest}")
+            print("Download from: https://github.com/netplexflix/ULDAS")
+            print(f"{'=' * 60}\n")
+        else:
+            print(f"✓ Up to date. Version: {VERSION}")
     except Exception:
-        print("Failed (error)")
+        if latest != VERSION:
+            print(f"Update may be available (current: {VERSION}, latest: {latest})")
+        else:
+            print(f"✓ Up to date. Version: {VERSION}")
+
+
+def check_for_updates() -> None:
+    """Print whether a newer release exists without stalling startup.
+
+    The lookup runs on a daemon thread.  If it is not done within
+    ``_UPDATE_CHECK_WAIT`` (a cold cache waiting on GitHub), processing
+    starts anyway and ``report_update_check`` prints the result once the
+    run is over.
+    """
+    global _pending_check
+    print("Checking for updates...", end=" ", flush=True)
+    outcome: dict = {}
+
+    def _check():
+        try:
+            outcome["latest"] = _fetch_latest_version()
+        except requests.exceptions.RequestException:
+            outcome["error"] = "network error"
+        except Exception:
+            outcome["error"] = "error"
+
+    worker = threading.Thread(target=_check, name="uldas-update-check", daemon=True)
+    worker.start()
+    worker.join(_UPDATE_CHECK_WAIT)
+    if worker.is_alive():
+        print("continuing in the background; result after this run")
+        _pending_check = (worker, outcome)
+    else:
+        _print_outcome(outcome)
+
+
+def report_update_check() -> None:
+    """Print the result of a startup check that was still running when
+    processing began.  Does nothing if there is none."""
+    global _pending_check
+    if _pending_check is None:
+        return
+    worker, outcome = _pending_check
+    _pending_check = None
+    worker.join(_UPDATE_REPORT_WAIT)
+    print("Update check:", end=" ", flush=True)
+    if worker.is_alive():
+        print("Failed (no response)")
+    else:
+        _print_outcome(outcome)
+
+
+def _print_outcome(outcome: dict) -> None:
+    if "error" in outcome:
+        print(f"Failed ({outcome['error']})")
+    else:
+        _print_update_status(outcome.get("latest", ""))
 
 
 def get_update_status() -> dict:
     """Return update status as a dict for the web UI."""
     try:
-        url = "https://api.github.com/repos/netplexflix/ULDAS/releases/latest"
-        resp = requests.get(url, timeout=5)
-        resp.raise_for_status()
-        latest = resp.json().get("tag_name", "").lstrip("v")
+        latest = _fetch_latest_version()
         if not latest:
             return {"status": "unknown", "current": VERSION, "latest": None}
         try:
@@ -3,17 +3,53 @@
 import os
 import sys
 import re
+import json
 import zlib
 import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Iterator, List, Optional, Tuple
 
 import psutil
 
+from uldas.constants import (
+    ISO639_1_TO_2,
+    ISO639_2_TO_1,
+    ISO639_ALTERNATIVE_CODES,
+    LANGUAGE_CODES,
+    LANGUAGE_NAMES,
+)
+
+try:
+    import orjson
+except ImportError:  # optional speed-up
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+# ── JSON ─────────────────────────────────────────────────────────────────
+def loads_json(data):
+    """Parse ffprobe/mkvmerge JSON output, via orjson when installed.
+
+    orjson's decode error subclasses ``json.JSONDecodeError``, so callers
+    catch the same exception either way.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 # ── CPU limits ───────────────────────────────────────────────────────────
+_cpu_limits_applied = False
+
+
 def setup_cpu_limits() -> None:
-    """Lower process priority and pin to 75 % of cores."""
+    """Lower process priority and pin to 75 % of cores.  Only the first
+    call per process has any effect."""
+    global _cpu_limits_applied
+    if _cpu_limits_applied:
+        return
+    _cpu_limits_applied = True
     try:
         proc = psutil.Process()
 
@@ -24,11 +60,15 @@ def setup_cpu_limits() -> None:
 
         cpu_count = psutil.cpu_count()
         max_cores = max(1, int(cpu_count * 0.75))
+        cores = list(range(min(max_cores, cpu_count)))
 
-        if hasattr(proc, "cpu_affinity"):
-            cores = list(range(min(max_cores, cpu_count)))
+        if hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, cores)
+        elif hasattr(proc, "cpu_affinity"):
             proc.cpu_affinity(cores)
-            logger.info("Limited to %d of %d CPU cores", len(cores), cpu_count)
+        else:
+            return
+        logger.info("Limited to %d of %d CPU cores", len(cores), cpu_count)
 
     except Exception as exc:
         logger.warning("Could not set CPU limits: %s", exc)
@@ -41,40 +81,74 @@ def limit_subprocess_resources(cmd: list[str]) -> list[str]:
     return ["nice", "-n", "10"] + cmd
 
 
+# ── CUDA probe ───────────────────────────────────────────────────────────
+_cuda_available: Optional[bool] = None
+
+
+def cuda_available() -> bool:
+    """Whether CTranslate2 can see a CUDA device, probed once per process.
+
+    ctranslate2 is already loaded by faster-whisper, so unlike
+    ``torch.cuda.is_available()`` this costs no import on CPU-only hosts.
+    """
+    global _cuda_available
+    if _cuda_available is None:
+        try:
+            import ctranslate2
+            _cuda_available = ctranslate2.get_cuda_device_count() > 0
+        except Exception:
+            _cuda_available = False
+    return _cuda_available
+
+
 # ── Language-code helpers ────────────────────────────────────────────────
+# Every code normalize_language_code rewrites; anything else passes through.
+_NORMALIZED_CODES: dict[str, str] = {
+    **ISO639_ALTERNATIVE_CODES,
+    **ISO639_2_TO_1,
+    **dict.fromkeys(("", "und", "unknown", "undefined", "undetermined"), "und"),
+}
+
+
 def normalize_language_code(lang_code: str) -> str:
     """Normalise any language code to a 2-letter ISO 639-1 string."""
-    from uldas.constants import ISO639_2_TO_1, ISO639_ALTERNATIVE_CODES
-
     if not lang_code:
         return "und"
-
     lang_code = lang_code.lower().strip()
+    return _NORMALIZED_CODES.get(lang_code, lang_code)
 
-    if lang_code in ("", "und", "unknown", "undefined", "undetermined"):
-        return "und"
-    if lang_code == "zxx":
-        return "zxx"
 
-    if lang_code in ISO639_2_TO_1:
-        return ISO639_2_TO_1[lang_code]
-    if lang_code in ISO639_ALTERNATIVE_CODES:
-        return ISO639_ALTERNATIVE_CODES[lang_code]
-    if len(lang_code) == 2:
-        return lang_code
+_title_language_re: Optional["re.Pattern[str]"] = None
 
-    return lang_code
+
+def language_from_track_title(title: str) -> Optional[str]:
+    """Language code for a track title that names exactly one language
+    (``"English 5.1"``, ``"日本語"``), else None."""
+    global _title_language_re
+    if not title:
+        return None
+    if _title_language_re is None:
+        names = sorted((n for n, c in LANGUAGE_CODES.items() if c != "zxx"),
+                       key=len, reverse=True)
+        _title_language_re = re.compile(
+            r"(?<!\w)(" + "|".join(re.escape(n) for n in names) + r")(?!\w)",
+            re.IGNORECASE,
+        )
+    codes = {LANGUAGE_CODES.get(m.group(1).casefold())
+             for m in _title_language_re.finditer(title)}
+    codes.discard(None)
+    if len(codes) != 1:
+        return None
+    return normalize_language_code(codes.pop())
 
 
 def convert_iso639_1_to_2(code: str) -> str:
     """Convert 2-letter → 3-letter code."""
-    from uldas.constants import ISO639_1_TO_2
     return ISO639_1_TO_2.get(code.lower(), code)
 
 
 def get_language_name(language_code: str) -> str:
     """Human-readable name for a language code."""
-    from uldas.constants import LANGUAGE_NAMES
     name = LANGUAGE_NAMES.get(language_code)
     if name:
         return name
@@ -86,6 +160,30 @@ def get_language_name(language_code: str) -> str:
 
 
 # ── Hallucination detection ──────────────────────────────────────────────
+_REPEATED_CHAR_RE = re.compile(r"(.)\1{4,}")
+_REPEATED_CHUNK_RE = re.compile(r"(.{1,3})\1{3,}")
+# Khmer, Thai, Myanmar, Bengali and Georgian: scripts Whisper commonly
+# hallucinates on silent audio.
+_HALLUCINATED_SCRIPT_RE = re.compile(
+    "[\u1780-\u17FF\u0E00-\u0E7F\u1000-\u109F\u0980-\u09FF\u10A0-\u10FF]"
+)
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+
+_COMMON_HALLUCINATIONS = (
+    "okay up here we go", "i'm going to go get some water",
+    "let's go", "here we go", "okay let's go", "alright let's go",
+    "come on let's go", "okay here we go", "let me get some water",
+    "i'm going to get some water", "i need to get some water",
+    "hold on let me", "wait let me", "okay wait", "hold on",
+    "one second", "just a second", "give me a second", "let me just",
+)
+_GENERIC_HALLUCINATION_RES = tuple(re.compile(p) for p in (
+    r"\b(okay|ok|alright|let's|here we go|come on)\b.*\b(go|water|get|just|wait)\b",
+    r"\bi'm (going to|gonna) (go|get)",
+    r"\b(hold on|wait|give me|let me) (a |just |)?(second|minute|moment)\b",
+))
+
+
 def is_likely_hallucination(text: str, show_details: bool = False) -> bool:
     """Return *True* if *text* looks like a Whisper hallucination."""
     if not text or len(text.strip()) == 0:
@@ -96,77 +194,107 @@ def is_likely_hallucination(text: str, show_details: bool = False) -> bool:
     if len(text) < 3:
         return True
 
-    if len(set(text.replace(" ", ""))) <= 3 and len(text) > 10:
+    chars = set(text)
+    chars.discard(" ")
+    if len(chars) <= 3 and len(text) > 10:
         return True
 
-    unique_chars = len(set(text.replace(" ", "").replace("\n", "")))
-    if unique_chars <= 2 and len(text) > 20:
+    chars.discard("\n")
+    if len(chars) <= 2 and len(text) > 20:
         return True
 
-    if re.search(r"(.)\1{4,}", text):
+    if _REPEATED_CHAR_RE.search(text):
         return True
-    if re.search(r"(.{1,3})\1{3,}", text):
+    if _REPEATED_CHUNK_RE.search(text):
         return True
 
-    # Non-Latin scripts commonly hallucinated on silent audio
-    non_latin = 0
-    for ch in text:
-        cp = ord(ch)
-        if (0x1780 <= cp <= 0x17FF or 0x0E00 <= cp <= 0x0E7F or
-                0x1000 <= cp <= 0x109F or 0x0980 <= cp <= 0x09FF or
-                0x10A0 <= cp <= 0x10FF):
-            non_latin += 1
-    if len(text) > 0 and (non_latin / len(text)) > 0.7:
+    non_latin = len(_HALLUCINATED_SCRIPT_RE.findall(text))
+    if (non_latin / len(text)) > 0.7:
         return True
 
     words = text.split()
     if len(words) > 3:
-        if len(set(words)) / len(words) < 0.2:
+        unique_words = len(set(words))
+        if unique_words / len(words) < 0.2:
             return True
-
-    if len(text) > 20:
-        parts = text.split()
-        if len(parts) > 5 and len(set(parts)) <= 2:
+        if len(text) > 20 and len(words) > 5 and unique_words <= 2:
             return True
 
     try:
-        compressed = zlib.compress(text.encode("utf-8"))
-        if len(compressed) / len(text.encode("utf-8")) < 0.3:
+        encoded = text.encode("utf-8")
+        if len(zlib.compress(encoded)) / len(encoded) < 0.3:
             return True
     except Exception:
         pass
 
-    common_hallucinations = [
-        "okay up here we go", "i'm going to go get some water",
-        "let's go", "here we go", "okay let's go", "alright let's go",
-        "come on let's go", "okay here we go", "let me get some water",
-        "i'm going to get some water", "i need to get some water",
-        "hold on let me", "wait let me", "okay wait", "hold on",
-        "one second", "just a second", "give me a second", "let me just",
-    ]
-
-    clean = re.sub(r"[^\w\s]", "", text.lower().strip())
-    for phrase in common_hallucinations:
+    clean = _PUNCTUATION_RE.sub("", text.lower())
+    for phrase in _COMMON_HALLUCINATIONS:
         if phrase in clean:
             if show_details:
                 logger.info("Detected common hallucination phrase: '%s'", phrase)
             return True
 
-    if len(text.lower()) < 50:
-        generic = [
-            r"\b(okay|ok|alright|let's|here we go|come on)\b.*\b(go|water|get|just|wait)\b",
-            r"\bi'm (going to|gonna) (go|get)",
-            r"\b(hold on|wait|give me|let me) (a |just |)?(second|minute|moment)\b",
-        ]
-        for pat in generic:
-            if re.search(pat, clean):
+    if len(text) < 50:
+        for pat in _GENERIC_HALLUCINATION_RES:
+            if pat.search(clean):
                 if show_details:
-                    logger.info("Detected generic hallucination pattern: %s", pat)
+                    logger.info("Detected generic hallucination pattern: %s", pat.pattern)
                 return True
 
     return False
 
 
+# ── Directory walking ────────────────────────────────────────────────────
+# Directory listings walk_files keeps in flight at once.
+WALK_WORKERS = 8
+
+
+def _list_dir(path: str) -> Optional[Tuple[List[str], List[str]]]:
+    """Split *path* into ``(filenames, subdirs)`` the way os.walk does:
+    symlinked directories are neither descended into nor listed as files."""
+    files: List[str] = []
+    dirs: List[str] = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    files.append(entry.name)
+                elif not entry.is_symlink():
+                    dirs.append(entry.path)
+    except OSError:
+        return None
+    return files, dirs
+
+
+def walk_files(top: str, max_workers: int = WALK_WORKERS) -> Iterator[Tuple[str, List[str]]]:
+    """Yield ``(dirpath, filenames)`` for *top* and every directory below it.
+
+    Equivalent to ``os.walk(top, followlinks=False)`` minus dirnames, but
+    directory listings are fetched on a small thread pool so that on
+    network shares several round-trips are in flight at once.  Order is
+    completion order, not top-down, so callers sort what they keep;
+    unreadable directories are skipped like os.walk does.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers,
+                            thread_name_prefix="uldas-scan") as pool:
+        pending = {pool.submit(_list_dir, top): top}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                dirpath = pending.pop(fut)
+                listing = fut.result()
+                if listing is None:
+                    continue
+                files, dirs = listing
+                for subdir in dirs:
+                    pending[pool.submit(_list_dir, subdir)] = subdir
+                yield dirpath, files
+
+
 # ── Formatting ───────────────────────────────────────────────────────────
 def format_duration(seconds: float) -> str:
     h = int(seconds // 3600)
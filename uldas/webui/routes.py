@@ -139,6 +139,14 @@ CONFIG_OPTIONS = [
         "description": "Remux non-MKV video files (MP4, AVI, etc.) to MKV format before processing. The original file is replaced.",
         "advanced": False,
     },
+    {
+        "key": "allow_reencode",
+        "type": "bool",
+        "default": True,
+        "label": "Allow Video Re-encode",
+        "description": "When every copy-only remux fails, re-encode the video (x264, ultrafast) as a last resort. Disable to skip such files instead.",
+        "advanced": True,
+    },
     {
         "key": "show_details",
         "type": "bool",
@@ -212,13 +220,30 @@ CONFIG_OPTIONS = [
         "description": "Maximum continuous speech segment length (in seconds) before splitting.",
         "advanced": True,
     },
+    {
+        "key": "audio_filter",
+        "type": "bool",
+        "default": True,
+        "label": "Audio Clean-up Filter",
+        "description": "Boost, band-limit and normalise retry samples before analysis. Helps on quiet or noisy mixes; disable to make retries cheaper.",
+        "advanced": True,
+    },
     {
         "key": "whisper_model",
         "type": "select",
         "default": "small",
         "label": "Whisper Model",
         "description": "Whisper model size for audio language detection. Larger models are more accurate but slower and use more memory.",
-        "options": ["tiny", "base", "small", "medium", "large"],
+        "options": ["tiny", "base", "small", "medium", "large", "turbo"],
+        "advanced": True,
+    },
+    {
+        "key": "cascade_model",
+        "type": "select",
+        "default": "",
+        "label": "Cascade Model",
+        "description": "Optional smaller Whisper model tried first on each sample. The main model only runs when the cascade model is not confident. Empty = disabled.",
+        "options": ["", "tiny", "base", "small"],
         "advanced": True,
     },
     {
@@ -236,7 +261,8 @@ CONFIG_OPTIONS = [
         "default": "auto",
         "label": "Compute Type",
         "description": "Precision/performance trade-off. Auto-selects optimal type based on device.",
-        "options": ["auto", "int8", "float16", "float32"],
+        "options": ["auto", "int8", "int8_float16", "int8_bfloat16", "int16",
+                    "float16", "bfloat16", "float32"],
         "advanced": True,
     },
     {
@@ -247,6 +273,14 @@ CONFIG_OPTIONS = [
         "description": "Number of CPU threads to use. 0 = automatic detection based on system cores.",
         "advanced": True,
     },
+    {
+        "key": "max_workers",
+        "type": "int",
+        "default": 1,
+        "label": "Max Workers",
+        "description": "Number of video files processed at the same time. Workers share one Whisper model; ffmpeg extraction, inference and metadata writes overlap. 1 = process files one by one.",
+        "advanced": True,
+    },
     {
         "key": "confidence_threshold",
         "type": "float",
@@ -292,7 +326,7 @@ CONFIG_OPTIONS = [
         "type": "string",
         "default": "",
         "label": "Temporary Directory",
-        "description": "Custom temporary directory for audio/subtitle extraction. Leave empty to use system default (/tmp).",
+        "description": "Custom temporary directory for subtitle extraction. Leave empty to use /dev/shm on Linux when it has at least 512 MB free, otherwise the system default (/tmp).",
         "advanced": True,
     },
     {